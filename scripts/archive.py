@@ -0,0 +1,692 @@
+"""
+Item archive shared by the fetchers, change detection and the content generator.
+
+Content items live under data/<source>/ in one of two layouts:
+
+- files  - one pretty-printed JSON file per item (the default)
+- jsonl  - append-only monthly segments under data/<source>/archive/, one
+           compact JSON record per line, plus an offset index
+
+Setting DIGEST_ARCHIVE_FORMAT=jsonl makes the blog and video fetchers append
+to segments instead of writing files. DIGEST_ARCHIVE_COMPRESSION=gzip (or
+zstd, if the optional zstandard package is installed) compresses every
+record as its own gzip member / zstd frame, so single records can still be
+read with one seek.
+
+Segment layout (data/<source>/archive/):
+
+- YYYY-MM.jsonl[.gz|.zst] - records {"file": <item file name>, "item": {...}}
+- index.jsonl             - one line per record: file name, URL, segment,
+                            offset and length; later lines win for the same file
+- urls.idx                - URL-hash -> (segment, offset, length) hash table,
+                            rebuilt whenever index.jsonl has grown since
+
+Point reads (get_item, find_by_url) memory-map the segments and the URL
+table, so a lookup costs one hash probe and touches only the bytes of the
+record it returns, instead of parsing the whole history.
+
+Readers do not need to know which layout is in use: iter_items() yields loose
+JSON files and archived records alike (and the SQLite items table when
+DIGEST_STORE=sqlite), so a directory can be migrated gradually.
+
+Usage:
+    python scripts/archive.py pack               # move item files into segments
+    python scripts/archive.py unpack             # write item files back out
+    python scripts/archive.py stats
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import mmap
+import os
+import re
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+# Add parent directory to path to import local modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+# Sources that can be packed into segments
+ARCHIVED_SOURCES = ("blog", "videos")
+
+# Write layout: "files" (default) or "jsonl"
+ARCHIVE_FORMAT = os.environ.get("DIGEST_ARCHIVE_FORMAT", "files").lower()
+
+# Segment compression: "none" (default), "gzip" or "zstd"
+ARCHIVE_COMPRESSION = os.environ.get("DIGEST_ARCHIVE_COMPRESSION", "none").lower()
+
+ARCHIVE_DIRNAME = "archive"
+INDEX_FILENAME = "index.jsonl"
+URL_INDEX_FILENAME = "urls.idx"
+
+# urls.idx layout: header, JSON list of segment names, then an open-addressing
+# table of fixed-size slots (url hash, segment number, offset, length).
+# A zero hash marks an empty slot. The header records the size of index.jsonl
+# the table was built from; index.jsonl is append-only, so any other size
+# means the table is stale.
+URL_INDEX_MAGIC = b"DGURLS02"
+URL_INDEX_HEADER = struct.Struct("<8sIIQ")  # magic, slot count, segment list size, index size
+URL_INDEX_SLOT = struct.Struct("<QIQI")
+
+# Segment suffix per compression
+SEGMENT_SUFFIXES = {"none": ".jsonl", "gzip": ".jsonl.gz", "zstd": ".jsonl.zst"}
+
+# Side files that live next to the items but are not items
+NON_ITEM_FILES = {"url_dates.json"}
+
+# Item files are named YYYY-MM-DD-...; the month picks the segment
+MONTH_PREFIX = re.compile(r"^(\d{4}-\d{2})-\d{2}")
+
+# In-process index cache: archive directory -> {file name: (segment, offset, length)}
+_indexes: Dict[Path, Dict[str, Tuple[str, int, int]]] = {}
+
+# URLs of the indexed records, filled alongside _indexes: archive directory -> {url: file name}
+_index_urls: Dict[Path, Dict[str, str]] = {}
+
+# Memory maps of segments and URL tables, by file path
+_maps: Dict[Path, mmap.mmap] = {}
+
+# Opened URL tables: archive directory -> (map, slot count, segment names, table start)
+_url_indexes: Dict[Path, Tuple[mmap.mmap, int, List[str], int]] = {}
+
+# URL -> file name of loose item files, built on the first lookup that needs it
+# and rebuilt when the directory changes: directory -> (mtime_ns, {url: file name})
+_loose_urls: Dict[Path, Tuple[int, Dict[str, str]]] = {}
+
+
+def is_enabled() -> bool:
+    """
+    Check whether fetchers should append to JSONL segments (DIGEST_ARCHIVE_FORMAT=jsonl).
+
+    Returns:
+        bool: True if new items go into the archive instead of item files
+    """
+    return ARCHIVE_FORMAT == "jsonl"
+
+
+def archive_dir(directory: Path) -> Path:
+    """Get the segment directory of a source directory."""
+    return Path(directory) / ARCHIVE_DIRNAME
+
+
+def segment_name(filename: str, compression: str = ARCHIVE_COMPRESSION) -> str:
+    """
+    Get the segment an item file name belongs to.
+
+    Args:
+        filename: Item file name (YYYY-MM-DD-....json)
+        compression: "none", "gzip" or "zstd"
+
+    Returns:
+        Segment file name, e.g. "2025-01.jsonl.gz" ("undated.jsonl" without a date)
+    """
+    if compression == "zstd" and not ZSTD_AVAILABLE:
+        logger.warning("zstandard is not installed, compressing archive segments with gzip")
+        compression = "gzip"
+    match = MONTH_PREFIX.match(filename)
+    month = match.group(1) if match else "undated"
+    return month + SEGMENT_SUFFIXES.get(compression, ".jsonl")
+
+
+def encode_record(data: bytes, segment: str) -> bytes:
+    """Compress one record for a segment (each record is a standalone gzip member / zstd frame)."""
+    if segment.endswith(".gz"):
+        return gzip.compress(data)
+    if segment.endswith(".zst"):
+        return zstandard.ZstdCompressor().compress(data)
+    return data
+
+
+def decode_record(data: bytes, segment: str) -> Dict[str, Any]:
+    """Decompress and parse one record of a segment (bytes or a memoryview)."""
+    if segment.endswith(".gz"):
+        data = gzip.decompress(data)
+    elif segment.endswith(".zst"):
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError(f"Reading {segment} requires the zstandard package")
+        data = zstandard.ZstdDecompressor().decompress(data)
+    return json.loads(bytes(data))
+
+
+def load_index(directory: Path) -> Dict[str, Tuple[str, int, int]]:
+    """
+    Load the offset index of a source directory.
+
+    Malformed lines (e.g. a torn last line from an interrupted append) are
+    skipped with a warning; the records they pointed to stay unindexed.
+
+    Args:
+        directory: Source directory (e.g. data/blog)
+
+    Returns:
+        dict: Item file name -> (segment, offset, length); empty without an archive
+    """
+    path = archive_dir(directory)
+    if path in _indexes:
+        return _indexes[path]
+
+    index = {}
+    urls = {}
+    index_file = path / INDEX_FILENAME
+    if index_file.exists():
+        with open(index_file, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                    index[entry["file"]] = (entry["segment"], entry["offset"], entry["length"])
+                except (ValueError, KeyError, TypeError):
+                    logger.warning(f"Skipping malformed line in {index_file}: {line.strip()[:80]}")
+                    continue
+                if entry.get("url"):
+                    urls[entry["url"]] = entry["file"]
+    _indexes[path] = index
+    _index_urls[path] = urls
+    return index
+
+
+def append_item(directory: Path, filename: str, item: Dict[str, Any]) -> bool:
+    """
+    Append an item to its monthly segment and record it in the index.
+
+    Args:
+        directory: Source directory (e.g. data/blog)
+        filename: Item file name, as it would be in the files layout
+        item: Item dictionary
+
+    Returns:
+        bool: True on success, False if the segment or index could not be written
+    """
+    path = archive_dir(directory)
+    index = load_index(directory)
+    segment = segment_name(filename)
+    line = json.dumps({"file": filename, "item": item}, ensure_ascii=False) + "\n"
+    record = encode_record(line.encode("utf-8"), segment)
+
+    try:
+        path.mkdir(parents=True, exist_ok=True)
+        with open(path / segment, "ab") as f:
+            offset = f.tell()
+            f.write(record)
+        entry = {
+            "file": filename,
+            "url": item.get("url"),
+            "segment": segment,
+            "offset": offset,
+            "length": len(record),
+        }
+        index_line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+        with open(path / INDEX_FILENAME, "a+b") as f:
+            # Terminate a torn last line first, so it does not swallow this entry
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    index_line = b"\n" + index_line
+            f.write(index_line)
+    except OSError as e:
+        logger.error(f"Failed to append {filename} to {path / segment}: {e}")
+        return False
+
+    index[filename] = (segment, offset, len(record))
+    if item.get("url"):
+        _index_urls[path][item["url"]] = filename
+    # urls.idx no longer matches the size of index.jsonl and is rebuilt on the next lookup
+    _url_indexes.pop(path, None)
+    return True
+
+
+def item_exists(directory: Path, filename: str) -> bool:
+    """
+    Check whether an item file name is taken in either layout.
+
+    Args:
+        directory: Source directory (e.g. data/blog)
+        filename: Item file name
+
+    Returns:
+        bool: True if a loose file or an archived record has that name
+    """
+    return (Path(directory) / filename).exists() or filename in load_index(directory)
+
+
+def iter_archived(directory: Path) -> Iterator[Tuple[str, Any]]:
+    """
+    Iterate over the archived records of a source directory.
+
+    Segments are memory-mapped one at a time and records are decoded in
+    offset order; superseded records are skipped.
+
+    Args:
+        directory: Source directory (e.g. data/blog)
+
+    Yields:
+        Tuples of (item file name, item)
+    """
+    path = archive_dir(directory)
+    by_segment: Dict[str, List[Tuple[int, int, str]]] = {}
+    for filename, (segment, offset, length) in load_index(directory).items():
+        by_segment.setdefault(segment, []).append((offset, length, filename))
+
+    for segment in sorted(by_segment):
+        records = sorted(by_segment[segment])
+        try:
+            offset, length, _ = records[-1]
+            data = memoryview(_map_file(path / segment, offset + length))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping unreadable archive segment {path / segment}: {e}")
+            continue
+        for offset, length, filename in records:
+            try:
+                yield filename, decode_record(data[offset : offset + length], segment)["item"]
+            except (ValueError, KeyError, OSError) as e:
+                logger.warning(f"Skipping unreadable record {filename} in {segment}: {e}")
+
+
+def iter_items(directory: Path) -> Iterator[Tuple[str, Any]]:
+    """
+    Iterate over every item of a source directory, whatever the layout.
+
+    With DIGEST_STORE=sqlite items come from the store's items table first.
+    Loose JSON files are read next, then archived records; each file name is
+    yielded only once, so items not imported into the store are still seen.
+    Unreadable items are skipped with a warning.
+
+    Args:
+        directory: Source directory (e.g. data/blog)
+
+    Yields:
+        Tuples of (item file name, parsed JSON)
+    """
+    from scripts import store
+
+    directory = Path(directory)
+    seen = set()
+    if store.is_enabled():
+        for filename, item in store.get_store().iter_items(directory.name):
+            seen.add(filename)
+            yield filename, item
+
+    if directory.exists():
+        for file in directory.glob("*.json"):
+            if file.name in NON_ITEM_FILES or file.name in seen:
+                continue
+            seen.add(file.name)
+            try:
+                with open(file, encoding="utf-8") as f:
+                    yield file.name, json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable item file {file}: {e}")
+
+    for filename, item in iter_archived(directory):
+        if filename not in seen:
+            yield filename, item
+
+
+def get_item(directory: Path, filename: str) -> Optional[Dict[str, Any]]:
+    """
+    Load one item by file name, whatever the layout.
+
+    Args:
+        directory: Source directory (e.g. data/blog)
+        filename: Item file name
+
+    Returns:
+        Item dictionary, or None if it does not exist
+    """
+    from scripts import store
+
+    directory = Path(directory)
+    if store.is_enabled():
+        item = store.get_store().get_item(directory.name, filename)
+        if item is not None:
+            return item
+        # Not mirrored into the store (yet): fall back to the files
+
+    path = directory / filename
+    if path.exists():
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    entry = load_index(directory).get(filename)
+    if entry is None:
+        return None
+    return read_record(directory, *entry)
+
+
+def _map_file(path: Path, min_size: int = 0) -> mmap.mmap:
+    """Memory-map a file read-only, remapping it if it grew past the mapped size."""
+    mapped = _maps.get(path)
+    if mapped is None or len(mapped) < min_size:
+        if mapped is not None:
+            mapped.close()
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        _maps[path] = mapped
+    return mapped
+
+
+def close_maps() -> None:
+    """Close every memory map (before segments are rewritten or removed)."""
+    for mapped in _maps.values():
+        mapped.close()
+    _maps.clear()
+    _url_indexes.clear()
+
+
+def read_record(directory: Path, segment: str, offset: int, length: int) -> Dict[str, Any]:
+    """
+    Read one archived item through a memory map of its segment.
+
+    Only the record's own bytes are read (and decompressed); the rest of
+    the segment is never touched.
+
+    Args:
+        directory: Source directory (e.g. data/blog)
+        segment: Segment file name
+        offset: Byte offset of the record in the segment
+        length: Byte length of the record
+
+    Returns:
+        Item dictionary
+    """
+    mapped = _map_file(archive_dir(directory) / segment, offset + length)
+    return decode_record(memoryview(mapped)[offset : offset + length], segment)["item"]
+
+
+def url_hash(url: str) -> int:
+    """Hash a URL to a non-zero 64-bit key for urls.idx."""
+    digest = hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") or 1
+
+
+def build_url_index(directory: Path) -> Path:
+    """
+    Write urls.idx for a source directory from its index.jsonl.
+
+    Records indexed before URLs were stored in index.jsonl are decoded once
+    to read their URL. The file is written atomically (temp file + rename).
+
+    Args:
+        directory: Source directory (e.g. data/blog)
+
+    Returns:
+        Path: The URL index file
+    """
+    path = archive_dir(directory)
+    # Read the index once; its size is what the table is checked against later
+    data = (path / INDEX_FILENAME).read_bytes()
+    entries: Dict[str, Tuple[Optional[str], str, int, int]] = {}
+    for line in data.decode("utf-8", errors="replace").splitlines():
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+            entries[entry["file"]] = (
+                entry.get("url"),
+                entry["segment"],
+                entry["offset"],
+                entry["length"],
+            )
+        except (ValueError, KeyError, TypeError):
+            # Skipped like load_index does, e.g. a torn line from an interrupted append
+            logger.warning(f"Skipping malformed line in {path / INDEX_FILENAME}: {line[:80]}")
+
+    segments = sorted({segment for _, segment, _, _ in entries.values()})
+    segment_numbers = {segment: number for number, segment in enumerate(segments)}
+
+    # Keep the table at most half full so probe chains stay short
+    slots = 8
+    while slots < 2 * len(entries):
+        slots *= 2
+    table = bytearray(slots * URL_INDEX_SLOT.size)
+
+    for url, segment, offset, length in entries.values():
+        if url is None:
+            url = read_record(directory, segment, offset, length).get("url")
+        if not url:
+            continue
+        key = url_hash(url)
+        slot = key & (slots - 1)
+        while URL_INDEX_SLOT.unpack_from(table, slot * URL_INDEX_SLOT.size)[0]:
+            slot = (slot + 1) & (slots - 1)
+        URL_INDEX_SLOT.pack_into(
+            table, slot * URL_INDEX_SLOT.size, key, segment_numbers[segment], offset, length
+        )
+
+    segment_list = json.dumps(segments).encode("utf-8")
+    index_path = path / URL_INDEX_FILENAME
+    temp_path = index_path.with_suffix(".tmp")
+    with open(temp_path, "wb") as f:
+        f.write(URL_INDEX_HEADER.pack(URL_INDEX_MAGIC, slots, len(segment_list), len(data)))
+        f.write(segment_list)
+        f.write(table)
+    temp_path.replace(index_path)
+    return index_path
+
+
+def _read_url_index_header(url_index: Path) -> Optional[Tuple[int, int, int]]:
+    """Read (slot count, segment list size, index size) from urls.idx, or None if unusable."""
+    try:
+        with open(url_index, "rb") as f:
+            header = f.read(URL_INDEX_HEADER.size)
+    except OSError:
+        return None
+    if len(header) < URL_INDEX_HEADER.size:
+        return None
+    magic, slots, segment_list_size, index_size = URL_INDEX_HEADER.unpack(header)
+    if magic != URL_INDEX_MAGIC:
+        return None
+    return slots, segment_list_size, index_size
+
+
+def _open_url_index(directory: Path) -> Optional[Tuple[mmap.mmap, int, List[str], int]]:
+    """Map urls.idx of a source directory, rebuilding it first if index.jsonl has changed."""
+    path = archive_dir(directory)
+    if path in _url_indexes:
+        return _url_indexes[path]
+
+    index_file = path / INDEX_FILENAME
+    if not index_file.exists():
+        return None
+    url_index = path / URL_INDEX_FILENAME
+    header = _read_url_index_header(url_index)
+    if header is None or header[2] != index_file.stat().st_size:
+        stale = _maps.pop(url_index, None)
+        if stale is not None:
+            stale.close()
+        build_url_index(directory)
+        header = _read_url_index_header(url_index)
+        if header is None:
+            raise ValueError(f"{url_index} is not a URL index")
+
+    slots, segment_list_size, _ = header
+    mapped = _map_file(url_index)
+    start = URL_INDEX_HEADER.size
+    segments = json.loads(mapped[start : start + segment_list_size])
+    _url_indexes[path] = (mapped, slots, segments, start + segment_list_size)
+    return _url_indexes[path]
+
+
+def find_by_url(directory: Path, url: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up an item by its exact URL, whatever the layout.
+
+    Archived items are found with one probe of the memory-mapped urls.idx
+    and one read of the matching record. Records the table does not know
+    about yet (appended by another process since it was built) are found
+    through the in-memory index. Loose item files are indexed by URL on the
+    first lookup that misses the archive.
+
+    Args:
+        directory: Source directory (e.g. data/blog)
+        url: Item URL
+
+    Returns:
+        Item dictionary, or None if no item has that URL
+    """
+    from scripts import store
+
+    directory = Path(directory)
+    if store.is_enabled():
+        return store.get_store().find_by_url(url)
+
+    url_index = _open_url_index(directory)
+    if url_index is not None:
+        mapped, slots, segments, table_start = url_index
+        key = url_hash(url)
+        slot = key & (slots - 1)
+        while True:
+            slot_key, segment_number, offset, length = URL_INDEX_SLOT.unpack_from(
+                mapped, table_start + slot * URL_INDEX_SLOT.size
+            )
+            if not slot_key:
+                break
+            if slot_key == key:
+                item = read_record(directory, segments[segment_number], offset, length)
+                # Hashes can collide; the stored URL decides
+                if item.get("url") == url:
+                    return item
+            slot = (slot + 1) & (slots - 1)
+
+        index = load_index(directory)
+        filename = _index_urls[archive_dir(directory)].get(url)
+        if filename is not None:
+            item = read_record(directory, *index[filename])
+            if item.get("url") == url:
+                return item
+
+    if not directory.exists():
+        return None
+    mtime = directory.stat().st_mtime_ns
+    if directory not in _loose_urls or _loose_urls[directory][0] != mtime:
+        urls = {}
+        for file in directory.glob("*.json"):
+            if file.name in NON_ITEM_FILES:
+                continue
+            try:
+                with open(file, encoding="utf-8") as f:
+                    item = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable item file {file}: {e}")
+                continue
+            if isinstance(item, dict) and item.get("url"):
+                urls.setdefault(item["url"], file.name)
+        _loose_urls[directory] = (mtime, urls)
+
+    filename = _loose_urls[directory][1].get(url)
+    if filename is None:
+        return None
+    with open(directory / filename, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def pack(directory: Path) -> int:
+    """
+    Move the loose item files of a source directory into segments.
+
+    Each file is deleted only after its record and index line are written.
+
+    Args:
+        directory: Source directory (e.g. data/blog)
+
+    Returns:
+        int: Number of items packed
+    """
+    count = 0
+    for file in sorted(Path(directory).glob("*.json")):
+        if file.name in NON_ITEM_FILES:
+            continue
+        try:
+            with open(file, encoding="utf-8") as f:
+                item = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Not packing unreadable item file {file}: {e}")
+            continue
+        if append_item(directory, file.name, item):
+            file.unlink()
+            count += 1
+    return count
+
+
+def unpack(directory: Path) -> int:
+    """
+    Write every archived item of a source directory back out as a file.
+
+    The archive directory is removed once all items are written.
+
+    Args:
+        directory: Source directory (e.g. data/blog)
+
+    Returns:
+        int: Number of items unpacked
+    """
+    path = archive_dir(directory)
+    count = 0
+    for filename, item in iter_archived(directory):
+        target = Path(directory) / filename
+        if not target.exists():
+            target.write_text(json.dumps(item, indent=2, ensure_ascii=False), encoding="utf-8")
+            count += 1
+
+    close_maps()
+    if path.exists():
+        for file in path.iterdir():
+            file.unlink()
+        path.rmdir()
+    _indexes.pop(path, None)
+    _index_urls.pop(path, None)
+    return count
+
+
+def main():
+    """Pack, unpack or describe the item archives from the command line."""
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+
+    parser = argparse.ArgumentParser(description="Manage the JSONL item archives")
+    parser.add_argument("command", choices=["pack", "unpack", "stats"])
+    parser.add_argument(
+        "--source",
+        nargs="+",
+        choices=ARCHIVED_SOURCES,
+        default=list(ARCHIVED_SOURCES),
+        help="Sources to process (default: all)",
+    )
+    args = parser.parse_args()
+
+    for source in args.source:
+        directory = DATA_DIR / source
+        if args.command == "pack":
+            logger.info(f"Packed {pack(directory)} {source} items into {archive_dir(directory)}")
+        elif args.command == "unpack":
+            logger.info(f"Unpacked {unpack(directory)} {source} items into {directory}")
+        else:
+            loose = [f for f in directory.glob("*.json") if f.name not in NON_ITEM_FILES]
+            segments = sorted(archive_dir(directory).glob("*.jsonl*"))
+            size = sum(p.stat().st_size for p in segments)
+            print(
+                f"{source:<8} {len(loose):>6} files  {len(load_index(directory)):>6} archived  "
+                f"{len(segments):>4} segments  {size / 1024:>9.1f} KiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Benchmark change detection on a synthetic archive.
+
+Builds a temporary data/ tree with N blog posts, N videos, trainings and
+GitHub Next projects (half of each already tracked in metadata), then times
+the detect_*_changes functions at several archive sizes. With hashed
+indexes the time per item should stay flat as N grows; the "list lookup"
+column shows what the old list-based membership test costs for the same N.
+
+Usage:
+    python scripts/benchmark_detect_changes.py
+    python scripts/benchmark_detect_changes.py --sizes 1000 10000 50000
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+# Add parent directory to path to import local modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts import detect_changes
+
+
+DEFAULT_SIZES = [5000, 10000, 25000, 50000]
+
+
+def build_archive(data_dir: Path, count: int) -> dict:
+    """
+    Write a synthetic archive of `count` items per source.
+
+    Args:
+        data_dir: Root of the synthetic data/ tree
+        count: Number of items per source
+
+    Returns:
+        dict: Metadata tracking the first half of every source
+    """
+    tracked = count // 2
+    sources = {
+        "blog": lambda i: {
+            "title": f"Post {i}",
+            "url": f"https://github.blog/post-{i}/",
+            "published": f"2025-01-01T00:00:{i % 60:02d}Z",
+            "summary": "Synthetic post",
+        },
+        "videos": lambda i: {
+            "title": f"Video {i}",
+            "video_id": f"vid{i:08d}",
+            "published": f"2025-01-01T00:00:{i % 60:02d}Z",
+        },
+        "trainings": lambda i: {
+            "title": f"Training {i}",
+            "id": f"training-{i}",
+            "url": f"https://example.com/training-{i}/",
+            "provider": "Synthetic",
+        },
+        "github-next": lambda i: {
+            "title": f"Project {i}",
+            "url": f"https://githubnext.com/projects/project-{i}/",
+            "date": f"2025-01-01T00:00:{i % 60:02d}Z",
+        },
+    }
+
+    for source, make_item in sources.items():
+        directory = data_dir / source
+        directory.mkdir(parents=True)
+        for i in range(count):
+            with open(directory / f"{i:08d}.json", "w", encoding="utf-8") as f:
+                json.dump(make_item(i), f)
+
+    return {
+        "sources": {
+            "github_blog": {
+                "entries": {str(i): {"url": f"https://github.blog/post-{i}/"} for i in range(tracked)}
+            },
+            "youtube": {"videos": {f"vid{i:08d}": {} for i in range(tracked)}},
+        },
+        "training_ids": [f"training-{i}" for i in range(tracked)],
+        "github_next_urls": [f"https://githubnext.com/projects/project-{i}/" for i in range(tracked)],
+    }
+
+
+def time_call(func, *args) -> float:
+    """Return the wall-clock seconds taken by func(*args)."""
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def list_lookup_seconds(count: int) -> float:
+    """
+    Time `count` membership tests against a list of count // 2 URLs.
+
+    This is the dedup check detect_blog_changes used to do per post.
+    """
+    tracked = [f"https://github.blog/post-{i}/" for i in range(count // 2)]
+    start = time.perf_counter()
+    for i in range(count):
+        _ = f"https://github.blog/post-{i}/" in tracked
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the benchmark and print a table of timings."""
+    parser = argparse.ArgumentParser(description="Benchmark change detection scaling")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="Items per source to benchmark (default: 5000 10000 25000 50000)",
+    )
+    args = parser.parse_args()
+
+    detectors = [
+        ("blog", detect_changes.detect_blog_changes),
+        ("videos", detect_changes.detect_video_changes),
+        ("trainings", detect_changes.detect_trainings_changes),
+        ("github-next", detect_changes.detect_github_next_changes),
+    ]
+
+    print(f"{'items':>8} {'source':<12} {'seconds':>9} {'us/item':>9} {'list lookup':>12}")
+    for count in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp)
+            metadata = build_archive(data_dir, count)
+            detect_changes.DATA_DIR = data_dir
+
+            for source, detector in detectors:
+                seconds = time_call(detector, metadata)
+                print(f"{count:>8} {source:<12} {seconds:>9.3f} {seconds / count * 1e6:>9.1f}", end="")
+                if source == "blog":
+                    print(f" {list_lookup_seconds(count):>11.3f}s")
+                else:
+                    print()
+
+
+if __name__ == "__main__":
+    main()
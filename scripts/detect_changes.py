@@ -7,43 +7,37 @@ by comparing current content with previously tracked metadata.
 
 import hashlib
 import json
+import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+# Add parent directory to path to import local modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts import archive, store
+from scripts import metadata as metadata_store
+
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+# Keyed on stat data, which differs on every checkout, so it is kept out of git
+DOC_HASH_CACHE_FILE = DATA_DIR / "doc-hash-cache.json"
+CHANGE_JOURNAL_FILE = DATA_DIR / "changes-journal.jsonl"
+CHANGE_JOURNAL_CURSOR = DATA_DIR / "changes-journal.cursor.json"
+
+# Read size for the streaming hasher
+HASH_CHUNK_SIZE = 1 << 16
 
 
 def load_metadata() -> Dict[str, Any]:
     """
-    Load metadata from data/metadata.json
+    Read metadata (metadata.json or the SQLite store) without modifying it
 
     Returns:
-        Dict containing metadata, or empty structure if file doesn't exist
-    """
-    metadata_path = Path(__file__).parent.parent / "data" / "metadata.json"
-
-    if not metadata_path.exists():
-        return {
-            "last_updated": None,
-            "sources": {
-                "github_docs": {"files": {}},
-                "github_blog": {"entries": {}, "blog_urls": []},
-                "youtube": {"videos": {}, "video_ids": []},
-            },
-        }
-
-    try:
-        with open(metadata_path, encoding="utf-8") as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"[ERROR] Failed to load metadata: {e}")
-        return {
-            "last_updated": None,
-            "sources": {
-                "github_docs": {"files": {}},
-                "github_blog": {"entries": {}, "blog_urls": []},
-                "youtube": {"videos": {}, "video_ids": []},
-            },
-        }
+        Dict containing metadata, with defaults if it is missing or unreadable
+    """
+    return metadata_store.read_metadata()
 
 
 def calculate_hash(content: str) -> str:
@@ -59,6 +53,85 @@ def calculate_hash(content: str) -> str:
     return hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
 
 
+def load_hash_cache() -> Dict[str, Dict[str, Any]]:
+    """
+    Load the persistent doc hash cache from data/doc-hash-cache.json
+
+    The cache is local to the working copy (it is git-ignored): its stat
+    signatures would not match on a fresh checkout anyway, where every doc
+    is simply hashed once.
+
+    Returns:
+        Dict mapping file name to {"size", "mtime_ns", "inode", "hash"},
+        or an empty dict if the cache is missing or unreadable
+    """
+    try:
+        with open(DOC_HASH_CACHE_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"[WARN] Ignoring unreadable hash cache: {e}")
+        return {}
+
+
+def save_hash_cache(cache: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Save the doc hash cache atomically
+
+    Args:
+        cache: Dict mapping file name to its stat signature and hash
+    """
+    temp_path = DOC_HASH_CACHE_FILE.with_suffix(".tmp")
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+        temp_path.replace(DOC_HASH_CACHE_FILE)
+    except Exception as e:
+        print(f"[ERROR] Failed to save hash cache: {e}")
+
+
+def cached_file_hash(filepath: Path, cache: Dict[str, Dict[str, Any]]) -> str:
+    """
+    Hash a file, reusing the cached hash if its stat signature is unchanged
+
+    Files whose (size, mtime_ns, inode) match the cache entry are not read.
+    Other files are hashed with a streaming SHA-256 over the same text that
+    calculate_hash() would see, and the cache entry is updated in place.
+
+    Args:
+        filepath: Path to file
+        cache: Hash cache from load_hash_cache(), keyed by file name
+
+    Returns:
+        First 12 characters of hex digest (as calculate_hash), or the hash
+        of empty content if the file cannot be read
+    """
+    try:
+        stat = filepath.stat()
+    except OSError as e:
+        print(f"[ERROR] Failed to stat {filepath}: {e}")
+        return calculate_hash("")
+
+    signature = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "inode": stat.st_ino}
+    entry = cache.get(filepath.name)
+    if entry and all(entry.get(key) == value for key, value in signature.items()):
+        return entry["hash"]
+
+    hasher = hashlib.sha256()
+    try:
+        with open(filepath, encoding="utf-8") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), ""):
+                hasher.update(chunk.encode("utf-8"))
+    except Exception as e:
+        print(f"[ERROR] Failed to read {filepath}: {e}")
+        return calculate_hash("")
+
+    file_hash = hasher.hexdigest()[:12]
+    cache[filepath.name] = {**signature, "hash": file_hash}
+    return file_hash
+
+
 def safe_read_file(filepath: Path) -> str:
     """
     Safely read file content
@@ -77,16 +150,23 @@ def safe_read_file(filepath: Path) -> str:
         return ""
 
 
-def detect_doc_changes() -> Dict[str, Any]:
+def detect_doc_changes(metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Detect changes in documentation files using doc_versions metadata.
 
+    Args:
+        metadata: Already loaded metadata (loaded from disk if omitted)
+
     Returns:
         Dict with keys: changed, new, unchanged, deleted
         Changed docs include diff information (timestamp, lines added/removed)
     """
-    metadata = load_metadata()
-    docs_dir = Path(__file__).parent.parent / "data" / "docs"
+    if metadata is None:
+        metadata = load_metadata()
+    docs_dir = DATA_DIR / "docs"
+
+    hash_cache = load_hash_cache()
+    original_cache = {name: dict(entry) for name, entry in hash_cache.items()}
 
     doc_versions = metadata.get("doc_versions", {})
     content_hashes = metadata.get("content_hashes", {})
@@ -96,6 +176,8 @@ def detect_doc_changes() -> Dict[str, Any]:
     unchanged = []
     deleted = []
 
+    current_files = set()
+
     # Check for new and changed files
     if docs_dir.exists():
         for doc_file in docs_dir.glob("*.md"):
@@ -103,9 +185,9 @@ def detect_doc_changes() -> Dict[str, Any]:
                 continue  # Skip summary file
 
             filename = doc_file.name
+            current_files.add(filename)
             doc_name = doc_file.stem
-            content = safe_read_file(doc_file)
-            current_hash = calculate_hash(content)
+            current_hash = cached_file_hash(doc_file, hash_cache)
 
             hash_key = f"docs/{filename}"
 
@@ -131,60 +213,66 @@ def detect_doc_changes() -> Dict[str, Any]:
                 new.append(filename)
 
     # Check for deleted files
-    current_files = (
-        {f.name for f in docs_dir.glob("*.md") if f.name != "scrape-summary.md"}
-        if docs_dir.exists()
-        else set()
-    )
     tracked_filenames = {k.replace("docs/", "") for k in content_hashes if k.startswith("docs/")}
-    deleted = list(tracked_filenames - current_files)
+    deleted = sorted(tracked_filenames - current_files)
+
+    # Forget removed files and persist the cache only if something changed
+    hash_cache = {name: entry for name, entry in hash_cache.items() if name in current_files}
+    if hash_cache != original_cache:
+        save_hash_cache(hash_cache)
 
     return {"changed": changed, "new": new, "unchanged": unchanged, "deleted": deleted}
 
 
-def detect_blog_changes() -> Dict[str, Any]:
+def detect_blog_changes(
+    metadata: Optional[Dict[str, Any]] = None,
+    items: Optional[Iterable[Tuple[str, Any]]] = None,
+) -> Dict[str, Any]:
     """
     Detect new blog posts (comparing URLs in metadata)
 
+    Args:
+        metadata: Already loaded metadata (loaded from disk if omitted)
+        items: (file name, item) pairs to check (every blog item if omitted)
+
     Returns:
         Dict with new_posts list and count
     """
-    metadata = load_metadata()
-    blog_dir = Path(__file__).parent.parent / "data" / "blog"
+    if metadata is None:
+        metadata = load_metadata()
+    blog_dir = DATA_DIR / "blog"
 
     tracked_entries = metadata.get("sources", {}).get("github_blog", {}).get("entries", {})
-    tracked_urls = [entry.get("url", "") for entry in tracked_entries.values()]
+    tracked_urls = {entry.get("url", "") for entry in tracked_entries.values()}
 
     new_posts = []
 
     # Read all blog post files
-    if blog_dir.exists():
-        for blog_file in blog_dir.glob("*.json"):
-            try:
-                with open(blog_file, encoding="utf-8") as f:
-                    posts = json.load(f)
-
-                # Handle both list and dict structures
-                if isinstance(posts, list):
-                    post_list = posts
-                elif isinstance(posts, dict) and "posts" in posts:
-                    post_list = posts["posts"]
-                else:
-                    post_list = [posts]
-
-                for post in post_list:
-                    url = post.get("url", post.get("link", ""))
-                    if url and url not in tracked_urls:
-                        new_posts.append(
-                            {
-                                "title": post.get("title", ""),
-                                "url": url,
-                                "date": post.get("published", post.get("date", "")),
-                                "summary": post.get("summary", post.get("description", ""))[:200],
-                            }
-                        )
-            except Exception as e:
-                print(f"[ERROR] Failed to read blog file {blog_file}: {e}")
+    if items is None:
+        items = archive.iter_items(blog_dir)
+    for blog_file, posts in items:
+        try:
+            # Handle both list and dict structures
+            if isinstance(posts, list):
+                post_list = posts
+            elif isinstance(posts, dict) and "posts" in posts:
+                post_list = posts["posts"]
+            else:
+                post_list = [posts]
+
+            for post in post_list:
+                url = post.get("url", post.get("link", ""))
+                if url and url not in tracked_urls:
+                    new_posts.append(
+                        {
+                            "title": post.get("title", ""),
+                            "url": url,
+                            "date": post.get("published", post.get("date", "")),
+                            "summary": post.get("summary", post.get("description", ""))[:200],
+                        }
+                    )
+        except Exception as e:
+            print(f"[ERROR] Failed to read blog file {blog_file}: {e}")
 
     # Sort by date (newest first)
     new_posts.sort(key=lambda x: x.get("date", ""), reverse=True)
@@ -192,15 +280,23 @@ def detect_blog_changes() -> Dict[str, Any]:
     return {"new_posts": new_posts, "count": len(new_posts)}
 
 
-def detect_video_changes() -> Dict[str, Any]:
+def detect_video_changes(
+    metadata: Optional[Dict[str, Any]] = None,
+    items: Optional[Iterable[Tuple[str, Any]]] = None,
+) -> Dict[str, Any]:
     """
     Detect new videos (comparing video IDs in metadata)
 
+    Args:
+        metadata: Already loaded metadata (loaded from disk if omitted)
+        items: (file name, item) pairs to check (every video if omitted)
+
     Returns:
         Dict with new_videos list and count
     """
-    metadata = load_metadata()
-    videos_dir = Path(__file__).parent.parent / "data" / "videos"
+    if metadata is None:
+        metadata = load_metadata()
+    videos_dir = DATA_DIR / "videos"
 
     tracked_videos = metadata.get("sources", {}).get("youtube", {}).get("videos", {})
     tracked_video_ids = set(tracked_videos.keys())
@@ -208,33 +304,31 @@ def detect_video_changes() -> Dict[str, Any]:
     new_videos = []
 
     # Read all video files
-    if videos_dir.exists():
-        for video_file in videos_dir.glob("*.json"):
-            try:
-                with open(video_file, encoding="utf-8") as f:
-                    videos = json.load(f)
-
-                # Handle both list and dict structures
-                if isinstance(videos, list):
-                    video_list = videos
-                elif isinstance(videos, dict) and "videos" in videos:
-                    video_list = videos["videos"]
-                else:
-                    video_list = [videos]
-
-                for video in video_list:
-                    video_id = video.get("video_id", video.get("id", ""))
-                    if video_id and video_id not in tracked_video_ids:
-                        new_videos.append(
-                            {
-                                "title": video.get("title", ""),
-                                "video_id": video_id,
-                                "date": video.get("published", video.get("date", "")),
-                                "thumbnail": video.get("thumbnail", ""),
-                            }
-                        )
-            except Exception as e:
-                print(f"[ERROR] Failed to read video file {video_file}: {e}")
+    if items is None:
+        items = archive.iter_items(videos_dir)
+    for video_file, videos in items:
+        try:
+            # Handle both list and dict structures
+            if isinstance(videos, list):
+                video_list = videos
+            elif isinstance(videos, dict) and "videos" in videos:
+                video_list = videos["videos"]
+            else:
+                video_list = [videos]
+
+            for video in video_list:
+                video_id = video.get("video_id", video.get("id", ""))
+                if video_id and video_id not in tracked_video_ids:
+                    new_videos.append(
+                        {
+                            "title": video.get("title", ""),
+                            "video_id": video_id,
+                            "date": video.get("published", video.get("date", "")),
+                            "thumbnail": video.get("thumbnail", ""),
+                        }
+                    )
+        except Exception as e:
+            print(f"[ERROR] Failed to read video file {video_file}: {e}")
 
     # Sort by date (newest first)
     new_videos.sort(key=lambda x: x.get("date", ""), reverse=True)
@@ -242,15 +336,19 @@ def detect_video_changes() -> Dict[str, Any]:
     return {"new_videos": new_videos, "count": len(new_videos)}
 
 
-def detect_trainings_changes() -> Dict[str, Any]:
+def detect_trainings_changes(metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Detect new or updated training resources.
 
+    Args:
+        metadata: Already loaded metadata (loaded from disk if omitted)
+
     Returns:
         Dict with keys: new_trainings, count
     """
-    metadata = load_metadata()
-    trainings_dir = Path(__file__).parent.parent / "data" / "trainings"
+    if metadata is None:
+        metadata = load_metadata()
+    trainings_dir = DATA_DIR / "trainings"
 
     # Get tracked training IDs
     tracked_ids = set(metadata.get("training_ids", []))
@@ -258,29 +356,25 @@ def detect_trainings_changes() -> Dict[str, Any]:
     new_trainings = []
 
     # Read all training files
-    if trainings_dir.exists():
-        for training_file in trainings_dir.glob("*.json"):
-            try:
-                with open(training_file, encoding="utf-8") as f:
-                    training = json.load(f)
-
-                training_id = training.get("id", "")
-                if training_id and training_id not in tracked_ids:
-                    new_trainings.append(
-                        {
-                            "title": training.get("title", ""),
-                            "id": training_id,
-                            "url": training.get("url", ""),
-                            "provider": training.get("provider", ""),
-                            "level": training.get("level", ""),
-                            "is_free": training.get("is_free", False),
-                            "certification": training.get("certification", False),
-                            "estimated_time": training.get("estimated_time", ""),
-                            "last_verified": training.get("last_verified", ""),
-                        }
-                    )
-            except Exception as e:
-                print(f"[ERROR] Failed to read training file {training_file}: {e}")
+    for training_file, training in archive.iter_items(trainings_dir):
+        try:
+            training_id = training.get("id", "")
+            if training_id and training_id not in tracked_ids:
+                new_trainings.append(
+                    {
+                        "title": training.get("title", ""),
+                        "id": training_id,
+                        "url": training.get("url", ""),
+                        "provider": training.get("provider", ""),
+                        "level": training.get("level", ""),
+                        "is_free": training.get("is_free", False),
+                        "certification": training.get("certification", False),
+                        "estimated_time": training.get("estimated_time", ""),
+                        "last_verified": training.get("last_verified", ""),
+                    }
+                )
+        except Exception as e:
+            print(f"[ERROR] Failed to read training file {training_file}: {e}")
 
     # Sort by provider, then by title
     new_trainings.sort(key=lambda x: (x.get("provider", ""), x.get("title", "")))
@@ -288,17 +382,21 @@ def detect_trainings_changes() -> Dict[str, Any]:
     return {"new_trainings": new_trainings, "count": len(new_trainings)}
 
 
-def detect_github_next_changes() -> Dict[str, Any]:
+def detect_github_next_changes(metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Detect new GitHub Next projects.
 
     GitHub Next projects are experimental and should be clearly marked as such.
 
+    Args:
+        metadata: Already loaded metadata (loaded from disk if omitted)
+
     Returns:
         Dict with keys: new_projects, count
     """
-    metadata = load_metadata()
-    github_next_dir = Path(__file__).parent.parent / "data" / "github-next"
+    if metadata is None:
+        metadata = load_metadata()
+    github_next_dir = DATA_DIR / "github-next"
 
     # Get tracked GitHub Next URLs
     tracked_urls = set(metadata.get("github_next_urls", []))
@@ -306,26 +404,22 @@ def detect_github_next_changes() -> Dict[str, Any]:
     new_projects = []
 
     # Read all GitHub Next project files
-    if github_next_dir.exists():
-        for project_file in github_next_dir.glob("*.json"):
-            try:
-                with open(project_file, encoding="utf-8") as f:
-                    project = json.load(f)
-
-                project_url = project.get("url", "")
-                if project_url and project_url not in tracked_urls:
-                    new_projects.append(
-                        {
-                            "title": project.get("title", ""),
-                            "url": project_url,
-                            "date": project.get("date", ""),
-                            "status": project.get("status", "Unknown"),
-                            "description": project.get("description", ""),
-                            "experimental": True,  # Always mark as experimental
-                        }
-                    )
-            except Exception as e:
-                print(f"[ERROR] Failed to read GitHub Next project file {project_file}: {e}")
+    for project_file, project in archive.iter_items(github_next_dir):
+        try:
+            project_url = project.get("url", "")
+            if project_url and project_url not in tracked_urls:
+                new_projects.append(
+                    {
+                        "title": project.get("title", ""),
+                        "url": project_url,
+                        "date": project.get("date", ""),
+                        "status": project.get("status", "Unknown"),
+                        "description": project.get("description", ""),
+                        "experimental": True,  # Always mark as experimental
+                    }
+                )
+        except Exception as e:
+            print(f"[ERROR] Failed to read GitHub Next project file {project_file}: {e}")
 
     # Sort by date (newest first)
     new_projects.sort(key=lambda x: x.get("date", ""), reverse=True)
@@ -337,14 +431,19 @@ def generate_change_summary() -> Dict[str, Any]:
     """
     Generate comprehensive change summary
 
+    Metadata is loaded once and each data directory is scanned once; the
+    returned details can be passed to get_whats_new() to build windowed
+    views without rescanning.
+
     Returns:
         Dict with has_changes flag, summary text, details, and timestamp
     """
-    docs = detect_doc_changes()
-    blog = detect_blog_changes()
-    videos = detect_video_changes()
-    github_next = detect_github_next_changes()
-    trainings = detect_trainings_changes()
+    metadata = load_metadata()
+    docs = detect_doc_changes(metadata)
+    blog = detect_blog_changes(metadata)
+    videos = detect_video_changes(metadata)
+    github_next = detect_github_next_changes(metadata)
+    trainings = detect_trainings_changes(metadata)
 
     # Calculate total changes
     total_docs_changes = len(docs["changed"]) + len(docs["new"]) + len(docs["deleted"])
@@ -434,12 +533,15 @@ def generate_change_summary() -> Dict[str, Any]:
     }
 
 
-def get_whats_new(days: int = 7) -> Dict[str, Any]:
+def get_whats_new(days: int = 7, details: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Get everything new in the last N days
 
     Args:
         days: Number of days to look back (default: 7)
+        details: "details" of a generate_change_summary() result to filter;
+            if omitted, docs, blog posts and videos are detected afresh (with
+            DIGEST_STORE=sqlite only items published in the window are read)
 
     Returns:
         Dict with period, total_changes, and lists of new items
@@ -447,9 +549,21 @@ def get_whats_new(days: int = 7) -> Dict[str, Any]:
     cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
     cutoff_str = cutoff_date.isoformat()
 
-    docs = detect_doc_changes()
-    blog = detect_blog_changes()
-    videos = detect_video_changes()
+    if details is None:
+        metadata = load_metadata()
+        blog_items = video_items = None
+        if store.is_enabled():
+            # Read just the window from the (source, published) index
+            blog_items = store.get_store().iter_items_since("blog", days)
+            video_items = store.get_store().iter_items_since("videos", days)
+        details = {
+            "docs": detect_doc_changes(metadata),
+            "blog": detect_blog_changes(metadata, blog_items),
+            "videos": detect_video_changes(metadata, video_items),
+        }
+    docs = details["docs"]
+    blog = details["blog"]
+    videos = details["videos"]
 
     # Filter by date
     new_docs = docs["new"] + docs["changed"]  # Recent changes
@@ -478,7 +592,7 @@ def save_change_summary(summary: Dict[str, Any]) -> None:
     Args:
         summary: Change summary dict from generate_change_summary()
     """
-    output_path = Path(__file__).parent.parent / "data" / "changes-summary.json"
+    output_path = DATA_DIR / "changes-summary.json"
 
     # Ensure data directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -509,7 +623,7 @@ def save_change_summary(summary: Dict[str, Any]) -> None:
             "new_trainings": summary["details"]["trainings"]["new_trainings"],
         },
         "summary_text": summary["summary"],
-        "whats_new_7_days": get_whats_new(7),
+        "whats_new_7_days": get_whats_new(7, summary["details"]),
     }
 
     try:
@@ -520,6 +634,189 @@ def save_change_summary(summary: Dict[str, Any]) -> None:
         print(f"[ERROR] Failed to save change summary: {e}")
 
 
+def journal_records(summary: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Flatten a change summary into journal records (without seq/timestamp)
+
+    Each record has a "key" that identifies the change, so a change that
+    is still reported by the next run is not journaled again.
+
+    Args:
+        summary: Change summary dict from generate_change_summary()
+
+    Returns:
+        List of dicts with keys: key, source, change, item
+    """
+    details = summary["details"]
+    records = []
+
+    def add(source: str, change: str, item_key: str, item: Any) -> None:
+        records.append(
+            {
+                "key": f"{source}:{change}:{item_key}",
+                "source": source,
+                "change": change,
+                "item": item,
+            }
+        )
+
+    for item in details["docs"]["changed"]:
+        add("docs", "changed", f"{item['filename']}@{item.get('timestamp', '')}", item)
+    for filename in details["docs"]["new"]:
+        add("docs", "new", filename, {"filename": filename})
+    for filename in details["docs"]["deleted"]:
+        add("docs", "deleted", filename, {"filename": filename})
+    for post in details["blog"]["new_posts"]:
+        add("blog", "new", post["url"], post)
+    for video in details["videos"]["new_videos"]:
+        add("videos", "new", video["video_id"], video)
+    for training in details["trainings"]["new_trainings"]:
+        add("trainings", "new", training["id"], training)
+    for project in details["github_next"]["new_projects"]:
+        add("github_next", "new", project["url"], project)
+
+    return records
+
+
+def iter_journal():
+    """
+    Iterate over the records of data/changes-journal.jsonl in order
+
+    Yields:
+        Dicts with keys: seq, timestamp, key, source, change, item
+    """
+    if not CHANGE_JOURNAL_FILE.exists():
+        return
+    with open(CHANGE_JOURNAL_FILE, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # A torn last line from an interrupted append; skip it
+                print(f"[WARN] Skipping malformed journal line: {line[:80]}")
+
+
+def load_journal_cursor() -> Dict[str, Any]:
+    """
+    Load the journal cursor from data/changes-journal.cursor.json
+
+    The cursor holds the last sequence number, the journal size it was
+    written for, and the keys reported by the last run. If it is missing or
+    does not match the journal (e.g. an interrupted append), it is rebuilt
+    with one scan, treating every key in the journal as already reported.
+
+    Returns:
+        Dict with keys: seq, size, keys
+    """
+    size = CHANGE_JOURNAL_FILE.stat().st_size if CHANGE_JOURNAL_FILE.exists() else 0
+    try:
+        with open(CHANGE_JOURNAL_CURSOR, encoding="utf-8") as f:
+            cursor = json.load(f)
+        if cursor.get("size") == size:
+            return cursor
+    except (OSError, ValueError):
+        pass
+
+    cursor = {"seq": 0, "size": size, "keys": []}
+    keys = set()
+    for record in iter_journal():
+        cursor["seq"] = max(cursor["seq"], record.get("seq", 0))
+        keys.add(record.get("key"))
+    cursor["keys"] = sorted(key for key in keys if key)
+    return cursor
+
+
+def save_journal_cursor(cursor: Dict[str, Any]) -> None:
+    """
+    Write the journal cursor atomically (temp file + rename)
+
+    Args:
+        cursor: Dict with keys: seq, size, keys
+    """
+    temp_path = CHANGE_JOURNAL_CURSOR.with_suffix(".tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(cursor, f)
+    temp_path.replace(CHANGE_JOURNAL_CURSOR)
+
+
+def append_to_journal(summary: Dict[str, Any]) -> int:
+    """
+    Append the changes in a summary to the change journal
+
+    The journal is append-only JSON Lines. Every record gets the run's
+    timestamp and a sequence number one higher than the last record's.
+    A change is journaled when it appears: changes the previous run already
+    reported are skipped, so an ongoing change is recorded once, while a
+    change that stops and happens again (e.g. a doc deleted, re-added and
+    deleted again) gets a new record. The journal itself is never re-read;
+    the last seq and the previous run's keys come from a small cursor file.
+
+    Args:
+        summary: Change summary dict from generate_change_summary()
+
+    Returns:
+        Number of records appended
+    """
+    cursor = load_journal_cursor()
+    previous_keys = set(cursor["keys"])
+    last_seq = cursor["seq"]
+
+    current_keys = set()
+    lines = []
+    for record in journal_records(summary):
+        if record["key"] in current_keys:
+            continue
+        current_keys.add(record["key"])
+        if record["key"] in previous_keys:
+            continue
+        last_seq += 1
+        entry = {"seq": last_seq, "timestamp": summary["timestamp"], **record}
+        lines.append(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    try:
+        if lines:
+            CHANGE_JOURNAL_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(CHANGE_JOURNAL_FILE, "a", encoding="utf-8") as f:
+                f.writelines(lines)
+            print(f"[INFO] Appended {len(lines)} changes to {CHANGE_JOURNAL_FILE}")
+        save_journal_cursor(
+            {
+                "seq": last_seq,
+                "size": CHANGE_JOURNAL_FILE.stat().st_size if CHANGE_JOURNAL_FILE.exists() else 0,
+                "keys": sorted(current_keys),
+            }
+        )
+    except Exception as e:
+        print(f"[ERROR] Failed to append to change journal: {e}")
+        return 0
+
+    return len(lines)
+
+
+def read_journal(since_seq: int = 0, days: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Read changes from the journal without rescanning the data directories
+
+    Args:
+        since_seq: Only return records with a sequence number above this
+        days: If set, only return records from the last N days
+
+    Returns:
+        List of journal records, oldest first
+    """
+    cutoff_str = (
+        (datetime.now(timezone.utc) - timedelta(days=days)).isoformat() if days is not None else ""
+    )
+    return [
+        record
+        for record in iter_journal()
+        if record.get("seq", 0) > since_seq and record.get("timestamp", "") >= cutoff_str
+    ]
+
+
 def main():
     """Main entry point - detect all changes and print summary"""
     print("[INFO] Detecting changes...")
@@ -540,6 +837,7 @@ def main():
 
     # Save to file
     save_change_summary(summary)
+    append_to_journal(summary)
     print("\nSaved to data/changes-summary.json")
 
 
@@ -3,8 +3,13 @@ Enrich blog post metadata with publish dates.
 
 This script:
 1. Extracts dates from changelog URLs (format: /changelog/YYYY-MM-DD-)
-2. Fetches dates from RSS feeds for blog posts without dates in URLs
+2. Looks up dates for blog posts without dates in URLs in a URL -> date index
+   built once from the RSS feeds, then in the saved post itself (found by
+   URL in the blog archive, see scripts/archive.py)
 3. Stores enriched metadata in data/blog/ directory
+
+Enrichment is incremental: URLs already in data/blog/url_dates.json are
+reused without any lookup, and the file is only rewritten when it changed.
 """
 
 import json
@@ -14,10 +19,16 @@ import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional
+from urllib.parse import urlparse
+
 
-import certifi
-import feedparser
-import requests
+# Add parent directory to path to import local modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts import archive
+from scripts.feeds import get_feed_entries
+from scripts.metadata import read_metadata
+from scripts.utils import safe_write_file
 
 
 # Configure logging
@@ -28,7 +39,7 @@ logger = logging.getLogger(__name__)
 REPO_ROOT = Path(__file__).parent.parent
 DATA_DIR = REPO_ROOT / "data"
 BLOG_DIR = DATA_DIR / "blog"
-METADATA_FILE = DATA_DIR / "metadata.json"
+URL_DATES_FILE = BLOG_DIR / "url_dates.json"
 
 # RSS Feed URLs
 GITHUB_BLOG_FEED = "https://github.blog/tag/github-copilot/feed/"
@@ -51,93 +62,184 @@ def extract_date_from_changelog_url(url: str) -> Optional[str]:
     return None
 
 
-def fetch_post_date_from_rss(url: str) -> Optional[str]:
+def normalize_url(url: str) -> str:
     """
-    Fetch publish date for a blog post from RSS feed.
+    Normalize a blog URL for date lookups.
+
+    Scheme, "www." prefix, host case, query string, fragment and trailing
+    slashes are ignored, so feed links and tracked URLs compare equal.
 
     Args:
         url: Blog post URL
 
     Returns:
-        ISO date string (YYYY-MM-DD) or None
+        Normalized key like "github.blog/changelog/2025-12-08-some-title"
     """
-    logger.info(f"Fetching date from RSS for: {url}")
+    parsed = urlparse(url.strip())
+    host = parsed.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    return f"{host}{parsed.path.rstrip('/')}"
+
+
+def build_date_index() -> Dict[str, str]:
+    """
+    Build a normalized-URL -> publish date index in a single pass.
+
+    Sources: the GitHub Blog and Changelog RSS feeds (shared feed snapshots).
+    Saved blog posts are looked up per URL instead (see saved_post_date).
+
+    Returns:
+        Dictionary mapping normalized URL -> ISO date string (YYYY-MM-DD)
+    """
+    index = {}
 
-    # Try both feeds
     for feed_url in [GITHUB_BLOG_FEED, GITHUB_CHANGELOG_FEED]:
         try:
-            response = requests.get(feed_url, timeout=30, verify=certifi.where())
-            response.raise_for_status()
-            feed = feedparser.parse(response.content)
-
-            for entry in feed.entries:
+            for entry in get_feed_entries(feed_url):
                 entry_url = entry.get("link", "").strip()
-                if entry_url == url or entry_url.rstrip("/") == url.rstrip("/"):
-                    # Found the entry, extract date
-                    published_parsed = entry.get("published_parsed") or entry.get("updated_parsed")
-                    if published_parsed:
-                        date = datetime(*published_parsed[:6])
-                        return date.strftime("%Y-%m-%d")
-
+                published_parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+                if entry_url and published_parsed:
+                    date = datetime(*published_parsed[:6]).strftime("%Y-%m-%d")
+                    index.setdefault(normalize_url(entry_url), date)
         except Exception as e:
-            logger.debug(f"Error fetching from {feed_url}: {e}")
+            logger.debug(f"Error reading entries from {feed_url}: {e}")
             continue
 
-    logger.warning(f"Could not find date for {url}")
+    logger.info(f"Built date index with {len(index)} URLs")
+    return index
+
+
+_date_index: Optional[Dict[str, str]] = None
+
+
+def get_date_index() -> Dict[str, str]:
+    """
+    Get the URL -> date index, building it on first use in this process.
+
+    Returns:
+        Dictionary mapping normalized URL -> ISO date string (YYYY-MM-DD)
+    """
+    global _date_index
+    if _date_index is None:
+        _date_index = build_date_index()
+    return _date_index
+
+
+def saved_post_date(url: str) -> Optional[str]:
+    """
+    Get the publish date of a blog post saved under data/blog/.
+
+    The post is found by URL through the archive's URL index, so only that
+    one record is read.
+
+    Args:
+        url: Blog post URL
+
+    Returns:
+        ISO date string (YYYY-MM-DD) or None
+    """
+    post = archive.find_by_url(BLOG_DIR, url)
+    published = post.get("published", "") if isinstance(post, dict) else ""
+    if re.match(r"\d{4}-\d{2}-\d{2}", published):
+        return published[:10]
     return None
 
 
-def enrich_metadata() -> Dict[str, str]:
+def fetch_post_date_from_rss(url: str) -> Optional[str]:
     """
-    Enrich blog URLs with publish dates.
+    Look up the publish date for a blog post in the RSS date index.
+
+    Args:
+        url: Blog post URL
 
     Returns:
-        Dictionary mapping URL -> ISO date string (YYYY-MM-DD)
+        ISO date string (YYYY-MM-DD) or None
     """
-    # Load metadata
-    if not METADATA_FILE.exists():
-        logger.error(f"Metadata file not found: {METADATA_FILE}")
+    date = get_date_index().get(normalize_url(url))
+    if not date:
+        logger.warning(f"Could not find date for {url}")
+    return date
+
+
+def load_enriched_metadata() -> Dict[str, str]:
+    """
+    Load the URL -> date mapping saved by a previous run.
+
+    Returns:
+        Dictionary mapping URL -> ISO date string (empty if none saved yet)
+    """
+    try:
+        with open(URL_DATES_FILE, encoding="utf-8") as f:
+            return json.load(f).get("url_dates", {})
+    except FileNotFoundError:
+        return {}
+    except (OSError, json.JSONDecodeError, AttributeError) as e:
+        logger.warning(f"Ignoring unreadable {URL_DATES_FILE}: {e}")
         return {}
 
-    with open(METADATA_FILE) as f:
-        metadata = json.load(f)
 
-    blog_urls = metadata.get("blog_urls", [])
-    logger.info(f"Processing {len(blog_urls)} blog URLs")
+def enrich_metadata(known_dates: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """
+    Enrich blog URLs with publish dates.
+
+    URLs already present in known_dates are reused as-is without any lookup;
+    only newly tracked URLs are resolved. Dates are taken from changelog URLs
+    where possible; every other URL is resolved against a single URL -> date
+    index, built only if at least one new URL needs it.
+
+    Args:
+        known_dates: Previously saved URL -> date mapping (see load_enriched_metadata)
+
+    Returns:
+        Dictionary mapping URL -> ISO date string (YYYY-MM-DD), merged with known_dates
+    """
+    url_to_date = dict(known_dates or {})
 
-    url_to_date = {}
+    # Load metadata (metadata.json or the SQLite store)
+    blog_urls = read_metadata().get("blog_urls", [])
+    new_urls = [url for url in blog_urls if url not in url_to_date]
+    logger.info(f"Processing {len(new_urls)} new of {len(blog_urls)} blog URLs")
 
-    for url in blog_urls:
+    resolved = 0
+    for url in new_urls:
         # Try extracting from URL first (for changelog entries)
         date = extract_date_from_changelog_url(url)
 
         if date:
-            logger.info(f"Extracted date from URL: {date} -> {url}")
+            logger.debug(f"Extracted date from URL: {date} -> {url}")
         else:
-            # Fetch from RSS feed
-            date = fetch_post_date_from_rss(url)
+            # The index is built once, on the first URL without a date in it
+            date = get_date_index().get(normalize_url(url)) or saved_post_date(url)
             if date:
-                logger.info(f"Fetched date from RSS: {date} -> {url}")
+                logger.debug(f"Found date: {date} -> {url}")
 
         if date:
             url_to_date[url] = date
+            resolved += 1
         else:
             logger.warning(f"No date found for: {url}")
 
+    logger.info(f"Resolved dates for {resolved}/{len(new_urls)} new URLs")
     return url_to_date
 
 
-def save_enriched_metadata(url_to_date: Dict[str, str]):
+def save_enriched_metadata(url_to_date: Dict[str, str]) -> bool:
     """
-    Save enriched metadata to blog directory.
+    Save enriched metadata to blog directory, only if the mapping changed.
+
+    The file is written atomically (temp file + rename), and generated_at is
+    only bumped when the URL -> date mapping actually differs from disk.
 
     Args:
         url_to_date: Dictionary mapping URL -> ISO date string
-    """
-    BLOG_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Create enriched metadata file
-    enriched_file = BLOG_DIR / "url_dates.json"
+    Returns:
+        bool: True if the file was written, False if it was already up to date
+    """
+    if url_to_date == load_enriched_metadata():
+        logger.info(f"{URL_DATES_FILE} is up to date, nothing to write")
+        return False
 
     enriched_data = {
         "generated_at": datetime.utcnow().isoformat() + "Z",
@@ -145,19 +247,20 @@ def save_enriched_metadata(url_to_date: Dict[str, str]):
         "total_urls": len(url_to_date),
     }
 
-    with open(enriched_file, "w") as f:
-        json.dump(enriched_data, f, indent=2, sort_keys=True)
+    if not safe_write_file(str(URL_DATES_FILE), json.dumps(enriched_data, indent=2, sort_keys=True)):
+        raise OSError(f"Failed to write {URL_DATES_FILE}")
 
-    logger.info(f"Saved enriched metadata to {enriched_file}")
+    logger.info(f"Saved enriched metadata to {URL_DATES_FILE}")
     logger.info(f"Total URLs with dates: {len(url_to_date)}")
+    return True
 
 
 def main():
     """Main entry point."""
     logger.info("Starting blog date enrichment...")
 
-    # Enrich metadata
-    url_to_date = enrich_metadata()
+    # Enrich only URLs that are not in url_dates.json yet
+    url_to_date = enrich_metadata(load_enriched_metadata())
 
     if not url_to_date:
         logger.error("No dates extracted, aborting")
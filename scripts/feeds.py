@@ -0,0 +1,236 @@
+"""
+Feed snapshot cache shared by every RSS consumer.
+
+The blog scraper, the date enrichment step and the content generator all read
+the same github.blog feeds. This module downloads each feed URL at most once
+per run and persists a snapshot under data/feeds/:
+
+- <key>.xml  - raw response bytes, exactly as served
+- <key>.json - parsed entries (JSON-serializable feedparser entries)
+
+Later consumers in the same process reuse the in-memory snapshot. The fetch
+stage (fetch_blog, fetch_youtube) always revalidates the feed with a
+conditional GET, so every pipeline run sees new entries; the later stages of
+the run (date enrichment, content generation) reuse the on-disk snapshot while
+it is fresher than SNAPSHOT_MAX_AGE_HOURS. In offline mode the on-disk
+snapshot is used whatever its age and the network is never touched.
+"""
+
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+from urllib.parse import urlparse
+
+import feedparser
+from loguru import logger
+
+from scripts.utils import (
+    conditional_get,
+    ensure_directory,
+    get_file_age_hours,
+    now_iso,
+    record_http_validators,
+    safe_write_file,
+    slugify,
+)
+
+
+FEEDS_DIR = Path(__file__).parent.parent / "data" / "feeds"
+
+# Snapshots younger than this are reused by enrich/generate instead of hitting
+# the network again (the fetchers always revalidate)
+SNAPSHOT_MAX_AGE_HOURS = 6
+
+# In-process cache: feed URL -> snapshot dict
+_snapshots: Dict[str, Dict[str, Any]] = {}
+
+
+def snapshot_paths(url: str) -> Tuple[Path, Path]:
+    """
+    Get the on-disk paths of a feed snapshot.
+
+    Args:
+        url: Feed URL
+
+    Returns:
+        Tuple of (raw bytes path, parsed entries path)
+    """
+    parsed = urlparse(url)
+    key = slugify(re.sub(r"[^\w]+", "-", f"{parsed.netloc}{parsed.path}{parsed.query}"))
+    return FEEDS_DIR / f"{key}.xml", FEEDS_DIR / f"{key}.json"
+
+
+def _to_jsonable(value: Any) -> Any:
+    """
+    Convert a feedparser value into plain JSON-serializable data.
+
+    struct_time values (published_parsed, updated_parsed) become 9-item lists,
+    which consumers can still unpack with datetime(*value[:6]).
+    """
+    if isinstance(value, time.struct_time):
+        return list(value)
+    if isinstance(value, dict):
+        return {key: _to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_jsonable(item) for item in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def load_snapshot(url: str) -> Dict[str, Any]:
+    """
+    Load the persisted snapshot for a feed URL, without touching the network.
+
+    Args:
+        url: Feed URL
+
+    Returns:
+        Snapshot dict, or an empty dict if no snapshot exists or it is unreadable
+    """
+    _, entries_path = snapshot_paths(url)
+    try:
+        with open(entries_path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable feed snapshot {entries_path}: {e}")
+        return {}
+
+
+def save_snapshot(url: str, raw: bytes, entries: List[Dict[str, Any]], bozo: bool) -> Dict:
+    """
+    Persist raw feed bytes and parsed entries under data/feeds/.
+
+    Args:
+        url: Feed URL
+        raw: Raw response body
+        entries: Parsed, JSON-serializable entries
+        bozo: Whether feedparser flagged the feed as malformed
+
+    Returns:
+        dict: The snapshot that was written
+    """
+    raw_path, entries_path = snapshot_paths(url)
+    ensure_directory(str(FEEDS_DIR))
+
+    snapshot = {
+        "url": url,
+        "fetched_at": now_iso(),
+        "bozo": bozo,
+        "entry_count": len(entries),
+        "entries": entries,
+    }
+
+    try:
+        temp_path = raw_path.with_suffix(raw_path.suffix + ".tmp")
+        temp_path.write_bytes(raw)
+        temp_path.replace(raw_path)
+    except OSError as e:
+        logger.error(f"Failed to write raw feed snapshot {raw_path}: {e}")
+
+    safe_write_file(str(entries_path), json.dumps(snapshot, ensure_ascii=False))
+    return snapshot
+
+
+def get_feed(
+    url: str,
+    max_age_hours: float = SNAPSHOT_MAX_AGE_HOURS,
+    offline: bool = False,
+    revalidate: bool = False,
+) -> Dict[str, Any]:
+    """
+    Get a feed snapshot, downloading the feed at most once per run.
+
+    Resolution order: in-process cache, fresh on-disk snapshot, network.
+    Network requests are conditional (ETag / Last-Modified); on a 304 the
+    previous snapshot is reused without parsing and marked "not_modified".
+    The validators belong to the snapshot, not to any one consumer: another
+    consumer may have downloaded the new entries first, so "not_modified"
+    does not mean a consumer has already processed them. Consumers diff the
+    entries against their own state instead. If the download fails, a stale
+    on-disk snapshot is used when available.
+
+    Args:
+        url: Feed URL
+        max_age_hours: Maximum age of an on-disk snapshot to reuse without refetching
+        offline: Only use the on-disk snapshot, whatever its age; never download
+        revalidate: Always ask the server (conditionally), however fresh the
+            on-disk snapshot is; used by the fetch stage
+
+    Returns:
+        Snapshot dict with at least an "entries" list (empty if nothing is available)
+    """
+    if url in _snapshots:
+        return _snapshots[url]
+
+    if offline:
+        snapshot = load_snapshot(url)
+        if not snapshot:
+            logger.warning(f"No feed snapshot for {url} (offline mode)")
+            snapshot = {"url": url, "entries": []}
+        _snapshots[url] = snapshot
+        return snapshot
+
+    _, entries_path = snapshot_paths(url)
+    if not revalidate and get_file_age_hours(str(entries_path)) < max_age_hours:
+        snapshot = load_snapshot(url)
+        if snapshot:
+            logger.debug(f"Using cached feed snapshot for {url}")
+            _snapshots[url] = snapshot
+            return snapshot
+
+    # Only ask for a 304 if there is a snapshot to fall back on
+    previous = load_snapshot(url)
+
+    try:
+        logger.info(f"Downloading feed {url}")
+        response = conditional_get(url, timeout=30, conditional=bool(previous))
+
+        if response.status_code == 304 and previous:
+            logger.info(f"Feed not modified since {previous.get('fetched_at')}: {url}")
+            # Restart the freshness window without rewriting the snapshot
+            os.utime(entries_path)
+            snapshot = {**previous, "not_modified": True}
+        else:
+            response.raise_for_status()
+
+            feed = feedparser.parse(response.content)
+            if feed.bozo:
+                logger.warning(f"Feed parsing warning: {feed.get('bozo_exception', 'Unknown')}")
+
+            entries = [_to_jsonable(entry) for entry in feed.entries]
+            snapshot = save_snapshot(url, response.content, entries, bool(feed.bozo))
+            # The snapshot now holds the entries for every consumer
+            record_http_validators(url, response)
+    except Exception as e:
+        logger.error(f"Failed to download feed {url}: {e}")
+        if previous:
+            logger.warning(f"Using stale feed snapshot from {previous.get('fetched_at')}")
+            snapshot = previous
+        else:
+            snapshot = {"url": url, "entries": []}
+
+    _snapshots[url] = snapshot
+    return snapshot
+
+
+def get_feed_entries(
+    url: str, offline: bool = False, revalidate: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Get the parsed entries of a feed (see get_feed).
+
+    Args:
+        url: Feed URL
+        offline: Only use the on-disk snapshot; never download
+        revalidate: Always revalidate with the server, however fresh the snapshot
+
+    Returns:
+        List of entry dicts with feedparser keys (title, link, summary, ...)
+    """
+    return get_feed(url, offline=offline, revalidate=revalidate).get("entries", [])
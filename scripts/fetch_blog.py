@@ -13,49 +13,21 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
-import certifi
-import feedparser
-import requests
-
 
 # Add parent directory to path to import local modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from scripts import archive
+from scripts.feeds import get_feed_entries
+from scripts.keywords import KeywordMatcher
+from scripts.metadata import add_blog_url, metadata_session
+from scripts.store import record_item
+
+
 try:
-    from scraper.metadata import add_blog_url, load_metadata
     from scraper.utils import ensure_dir, safe_write_file
 except ImportError:
     # Fallback implementations if modules don't exist yet
-    def add_blog_url(url: str) -> bool:
-        """Fallback: Add URL to metadata"""
-        metadata_file = Path(__file__).parent.parent / "data" / "metadata.json"
-        metadata_file.parent.mkdir(parents=True, exist_ok=True)
-
-        if metadata_file.exists():
-            with open(metadata_file) as f:
-                metadata = json.load(f)
-        else:
-            metadata = {"blog_urls": [], "youtube_urls": [], "last_updated": None}
-
-        if url in metadata.get("blog_urls", []):
-            return False
-
-        metadata.setdefault("blog_urls", []).append(url)
-        metadata["last_updated"] = datetime.utcnow().isoformat()
-
-        with open(metadata_file, "w") as f:
-            json.dump(metadata, f, indent=2)
-
-        return True
-
-    def load_metadata() -> dict:
-        """Fallback: Load metadata"""
-        metadata_file = Path(__file__).parent.parent / "data" / "metadata.json"
-        if metadata_file.exists():
-            with open(metadata_file) as f:
-                return json.load(f)
-        return {"blog_urls": [], "youtube_urls": [], "last_updated": None}
-
     def safe_write_file(filepath: Path, content: str) -> bool:
         """Fallback: Safely write file"""
         try:
@@ -88,6 +60,7 @@ GITHUB_COPILOT_CHANGELOG_FEED = "https://github.blog/changelog/label/copilot/fee
 
 # Keywords for filtering Copilot-related content
 COPILOT_KEYWORDS = ["copilot", "ai", "agent", "coding agent", "workspace agent", "extensions"]
+COPILOT_MATCHER = KeywordMatcher(COPILOT_KEYWORDS)
 
 # Base data directory
 DATA_DIR = Path(__file__).parent.parent / "data" / "blog"
@@ -103,24 +76,17 @@ def fetch_github_blog() -> List[Dict]:
     logger.info("Fetching GitHub Blog RSS feed...")
 
     try:
-        # Use requests to fetch with proper SSL verification
-        response = requests.get(GITHUB_BLOG_FEED, timeout=30, verify=certifi.where())
-        response.raise_for_status()
-
-        # Parse the fetched content with feedparser
-        feed = feedparser.parse(response.content)
-
-        if feed.bozo:
-            logger.warning(f"Feed parsing warning: {feed.get('bozo_exception', 'Unknown')}")
+        # Shared snapshot: revalidated here, then reused by the later stages of the run
+        feed_entries = get_feed_entries(GITHUB_BLOG_FEED, revalidate=True)
 
-        if not feed.entries:
+        if not feed_entries:
             logger.warning("No entries found in GitHub Blog feed")
             return []
 
-        logger.info(f"Found {len(feed.entries)} entries in GitHub Blog feed")
+        logger.info(f"Found {len(feed_entries)} entries in GitHub Blog feed")
 
         entries = []
-        for entry in feed.entries:
+        for entry in feed_entries:
             try:
                 parsed = parse_blog_entry(entry, source="github-blog")
                 if parsed:
@@ -146,24 +112,17 @@ def fetch_github_changelog() -> List[Dict]:
     logger.info("Fetching GitHub Changelog RSS feed...")
 
     try:
-        # Use requests to fetch with proper SSL verification
-        response = requests.get(GITHUB_CHANGELOG_FEED, timeout=30, verify=certifi.where())
-        response.raise_for_status()
+        # Shared snapshot: revalidated here, then reused by the later stages of the run
+        feed_entries = get_feed_entries(GITHUB_CHANGELOG_FEED, revalidate=True)
 
-        # Parse the fetched content with feedparser
-        feed = feedparser.parse(response.content)
-
-        if feed.bozo:
-            logger.warning(f"Feed parsing warning: {feed.get('bozo_exception', 'Unknown')}")
-
-        if not feed.entries:
+        if not feed_entries:
             logger.warning("No entries found in GitHub Changelog feed")
             return []
 
-        logger.info(f"Found {len(feed.entries)} entries in GitHub Changelog feed")
+        logger.info(f"Found {len(feed_entries)} entries in GitHub Changelog feed")
 
         entries = []
-        for entry in feed.entries:
+        for entry in feed_entries:
             try:
                 parsed = parse_blog_entry(entry, source="github-changelog")
                 if parsed:
@@ -192,22 +151,17 @@ def fetch_github_copilot_changelog() -> List[Dict]:
     logger.info("Fetching GitHub Copilot Changelog RSS feed...")
 
     try:
-        response = requests.get(GITHUB_COPILOT_CHANGELOG_FEED, timeout=30, verify=certifi.where())
-        response.raise_for_status()
-
-        feed = feedparser.parse(response.content)
-
-        if feed.bozo:
-            logger.warning(f"Feed parsing warning: {feed.get('bozo_exception', 'Unknown')}")
+        # Shared snapshot: revalidated here, then reused by the later stages of the run
+        feed_entries = get_feed_entries(GITHUB_COPILOT_CHANGELOG_FEED, revalidate=True)
 
-        if not feed.entries:
+        if not feed_entries:
             logger.warning("No entries found in GitHub Copilot Changelog feed")
             return []
 
-        logger.info(f"Found {len(feed.entries)} entries in GitHub Copilot Changelog feed")
+        logger.info(f"Found {len(feed_entries)} entries in GitHub Copilot Changelog feed")
 
         entries = []
-        for entry in feed.entries:
+        for entry in feed_entries:
             try:
                 parsed = parse_blog_entry(entry, source="github-changelog")
                 if parsed:
@@ -306,23 +260,18 @@ def filter_copilot_content(entries: List[Dict]) -> List[Dict]:
 
     for entry in entries:
         # Check title first (highest priority)
-        title_lower = entry.get("title", "").lower()
-        if any(keyword.lower() in title_lower for keyword in COPILOT_KEYWORDS):
+        if COPILOT_MATCHER.search(entry.get("title", "")):
             filtered.append(entry)
             continue
 
         # Check content and summary
-        content_lower = entry.get("content", "").lower()
-        summary_lower = entry.get("summary", "").lower()
-        combined_text = f"{content_lower} {summary_lower}"
-
-        if any(keyword.lower() in combined_text for keyword in COPILOT_KEYWORDS):
+        combined_text = f"{entry.get('content', '')} {entry.get('summary', '')}"
+        if COPILOT_MATCHER.search(combined_text):
             filtered.append(entry)
             continue
 
         # Check tags
-        tags_lower = [tag.lower() for tag in entry.get("tags", [])]
-        if any(keyword.lower() in tag for keyword in COPILOT_KEYWORDS for tag in tags_lower):
+        if any(COPILOT_MATCHER.search(tag) for tag in entry.get("tags", [])):
             filtered.append(entry)
             continue
 
@@ -375,50 +324,67 @@ def save_blog_posts(posts: List[Dict]) -> int:
     new_count = 0
     duplicate_count = 0
 
-    for post in posts:
-        url = post.get("url")
+    # Record all new URLs in memory and write metadata.json once at the end
+    with metadata_session():
+        for post in posts:
+            url = post.get("url")
 
-        # Check if already processed
-        if not add_blog_url(url):
-            duplicate_count += 1
-            logger.debug(f"Skipping duplicate: {url}")
-            continue
+            # Check if already processed
+            if not add_blog_url(url):
+                duplicate_count += 1
+                logger.debug(f"Skipping duplicate: {url}")
+                continue
 
-        # Extract date from published field
-        try:
-            published = post.get("published", "")
-            if published:
-                # Handle various date formats
-                date_part = published.split("T")[0] if "T" in published else published[:10]
-            else:
+            # Extract date from published field
+            try:
+                published = post.get("published", "")
+                if published:
+                    # Handle various date formats
+                    date_part = published.split("T")[0] if "T" in published else published[:10]
+                else:
+                    date_part = datetime.utcnow().strftime("%Y-%m-%d")
+            except Exception as e:
+                logger.warning(f"Failed to parse date, using current date: {e}")
                 date_part = datetime.utcnow().strftime("%Y-%m-%d")
-        except Exception as e:
-            logger.warning(f"Failed to parse date, using current date: {e}")
-            date_part = datetime.utcnow().strftime("%Y-%m-%d")
-
-        # Create filename
-        slug = create_slug(post.get("title", "untitled"))
-        filename = f"{date_part}-{slug}.json"
-        filepath = DATA_DIR / filename
-
-        # Avoid filename collisions
-        counter = 1
-        while filepath.exists():
-            filename = f"{date_part}-{slug}-{counter}.json"
+
+            # Create filename
+            slug = create_slug(post.get("title", "untitled"))
+            filename = f"{date_part}-{slug}.json"
             filepath = DATA_DIR / filename
-            counter += 1
 
-        # Write post data
-        try:
-            post_json = json.dumps(post, indent=2, ensure_ascii=False)
-            if safe_write_file(filepath, post_json):
-                logger.info(f"Saved: {filename}")
-                new_count += 1
-            else:
-                logger.error(f"Failed to save: {filename}")
-        except Exception as e:
-            logger.error(f"Error saving post {filename}: {e}")
-            continue
+            # Avoid filename collisions. A name already holding this URL was saved
+            # by a run that failed before writing metadata; keep that copy.
+            counter = 1
+            already_saved = None
+            while archive.item_exists(DATA_DIR, filename):
+                existing = archive.get_item(DATA_DIR, filename) or {}
+                if existing.get("url") == url:
+                    already_saved = existing
+                    break
+                filename = f"{date_part}-{slug}-{counter}.json"
+                filepath = DATA_DIR / filename
+                counter += 1
+            if already_saved is not None:
+                duplicate_count += 1
+                logger.info(f"Already saved as {filename}, recording it in metadata")
+                record_item("blog", filename, already_saved)
+                continue
+
+            # Write post data (or append it to the JSONL archive)
+            try:
+                if archive.is_enabled():
+                    saved = archive.append_item(DATA_DIR, filename, post)
+                else:
+                    saved = safe_write_file(filepath, json.dumps(post, indent=2, ensure_ascii=False))
+                if saved:
+                    logger.info(f"Saved: {filename}")
+                    record_item("blog", filename, post)
+                    new_count += 1
+                else:
+                    logger.error(f"Failed to save: {filename}")
+            except Exception as e:
+                logger.error(f"Error saving post {filename}: {e}")
+                continue
 
     if duplicate_count > 0:
         logger.info(f"{duplicate_count} duplicates skipped")
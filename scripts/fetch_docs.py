@@ -3,13 +3,33 @@
 Script to fetch and scrape GitHub Copilot documentation for the daily digest.
 """
 
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
 from bs4 import BeautifulSoup
 from loguru import logger
-from metadata import update_content_hash
+from metadata import metadata_session, update_content_hash
+
+
+# Add parent directory to path to import local modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.utils import (
+    HostRateLimiter,
+    conditional_get,
+    forget_http_validators,
+    record_http_validators,
+)
+
+
+# Concurrent fetch settings: at most DOCS_MAX_WORKERS requests in flight, and
+# no more than DOCS_REQUESTS_PER_SECOND (bursting to DOCS_BURST) per host
+DOCS_MAX_WORKERS = 4
+DOCS_REQUESTS_PER_SECOND = 2.0
+DOCS_BURST = 2
 
 
 def create_output_dir():
@@ -25,20 +45,59 @@ def create_output_dir():
     return output_dir
 
 
-def fetch_url(url):
-    """Fetch content from a URL with error handling."""
+def fetch_url(url, conditional=False):
+    """
+    Fetch a URL with error handling.
+
+    With conditional=True the request carries the stored ETag/Last-Modified
+    validators; check for status 304 (unchanged) before using the body.
+
+    Returns the response, or None on error.
+    """
     try:
-        headers = {"User-Agent": "Mozilla/5.0 (compatible; GitHub-Copilot-Daily-Digest/1.0)"}
         logger.info(f"Attempting to fetch URL: {url}")
-        response = requests.get(url, headers=headers, timeout=30)
+        response = conditional_get(url, timeout=30, conditional=conditional)
         response.raise_for_status()
-        logger.success(f"Successfully fetched URL: {url}")
-        return response.text
+        if response.status_code == 304:
+            logger.info(f"Not modified since last fetch: {url}")
+        else:
+            logger.success(f"Successfully fetched URL: {url}")
+        return response
     except requests.RequestException as e:
         logger.error(f"Error fetching {url}: {e}")
         return None
 
 
+def fetch_doc(url, conditional, rate_limiter):
+    """
+    Fetch one documentation page and extract its main text.
+
+    Runs on a worker thread, so it only does network and parsing work;
+    saving and metadata updates stay on the calling thread.
+
+    Returns a (response, text) tuple. The response is None if the fetch
+    failed, and text is None for a 304 or a failed fetch. If no main content
+    element is found, text is the raw HTML.
+    """
+    rate_limiter.acquire(url)
+    response = fetch_url(url, conditional=conditional)
+    if response is None or response.status_code == 304 or not response.text:
+        return response, None
+
+    soup = BeautifulSoup(response.text, "html.parser")
+    main_content = (
+        soup.find("article")
+        or soup.find("main")
+        or soup.find("div", class_="markdown-body")
+    )
+    if main_content:
+        logger.success(f"Extracted main content from {url}")
+        return response, main_content.get_text(separator="\n", strip=True)
+
+    logger.warning(f"Main content not found at {url}, saving raw HTML.")
+    return response, response.text
+
+
 def save_content(content, filename, output_dir):
     """Save content to a file in the output directory and track changes."""
     filepath = Path(output_dir) / filename
@@ -66,8 +125,14 @@ def save_content(content, filename, output_dir):
         logger.error(f"Failed to save file {filepath}: {e}")
 
 
-def scrape_copilot_docs():
-    """Scrape GitHub Copilot documentation and save to data/docs."""
+def scrape_copilot_docs(max_workers=DOCS_MAX_WORKERS):
+    """
+    Scrape GitHub Copilot documentation and save to data/docs.
+
+    Pages are fetched concurrently by up to max_workers threads, throttled
+    per host by a token-bucket rate limiter. Results are saved in docs_urls
+    order on this thread, so metadata updates are never concurrent.
+    """
     logger.info("Starting GitHub Copilot documentation scrape...")
     output_dir = create_output_dir()
 
@@ -119,32 +184,29 @@ def scrape_copilot_docs():
 
     successful_fetches = 0
 
-    for filename, url in docs_urls.items():
+    rate_limiter = HostRateLimiter(DOCS_REQUESTS_PER_SECOND, burst=DOCS_BURST)
+
+    def fetch(item):
+        filename, url = item
         logger.info(f"Fetching documentation for: {filename} from {url}")
-        content = fetch_url(url)
-        if content:
-            logger.debug(f"Parsing HTML content for {filename}")
-            soup = BeautifulSoup(content, "html.parser")
-            main_content = (
-                soup.find("article")
-                or soup.find("main")
-                or soup.find("div", class_="markdown-body")
-            )
-            if main_content:
-                text_content = main_content.get_text(separator="\n", strip=True)
-                logger.success(f"Extracted main content for {filename}")
-                save_content(text_content, filename, output_dir)
+        # Only revalidate when we still have the previously saved copy
+        return fetch_doc(url, (Path(output_dir) / filename).exists(), rate_limiter)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor, metadata_session():
+        results = executor.map(fetch, docs_urls.items())
+
+        for (filename, url), (response, content) in zip(docs_urls.items(), results):
+            if response is not None and response.status_code == 304:
+                logger.info(f"{filename} unchanged since last scrape, skipping")
                 successful_fetches += 1
-            else:
-                logger.warning(f"Main content not found for {filename}, saving raw HTML.")
+            elif content:
                 save_content(content, filename, output_dir)
                 successful_fetches += 1
-        else:
-            logger.warning(f"Fetch failed for {filename}, using fallback content.")
-            save_content(sample_content[filename], filename, output_dir)
-
-        # Be respectful and don't overwhelm the server
-        time.sleep(1)
+                record_http_validators(url, response)
+            else:
+                logger.warning(f"Fetch failed for {filename}, using fallback content.")
+                save_content(sample_content[filename], filename, output_dir)
+                forget_http_validators(url)
 
     # Create a summary file with timestamp
     timestamp = time.strftime("%Y-%m-%d %H:%M:%S UTC")
@@ -16,9 +16,8 @@ import re
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-import certifi
 import requests
 from bs4 import BeautifulSoup
 from loguru import logger
@@ -27,46 +26,15 @@ from loguru import logger
 # Add parent directory to path to import local modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from scripts.archive import item_exists, iter_items
+from scripts.metadata import add_github_next_url, metadata_session
+from scripts.store import record_item
+
+
 try:
-    from scraper.metadata import add_github_next_url, load_metadata
     from scraper.utils import ensure_dir, safe_write_file
 except ImportError:
     # Fallback implementations if modules don't exist yet
-    def add_github_next_url(url: str) -> bool:
-        """Fallback: Add URL to metadata"""
-        metadata_file = Path(__file__).parent.parent / "data" / "metadata.json"
-        metadata_file.parent.mkdir(parents=True, exist_ok=True)
-
-        if metadata_file.exists():
-            with open(metadata_file) as f:
-                metadata = json.load(f)
-        else:
-            metadata = {
-                "blog_urls": [],
-                "youtube_urls": [],
-                "github_next_urls": [],
-                "last_updated": None,
-            }
-
-        if url in metadata.get("github_next_urls", []):
-            return False
-
-        metadata.setdefault("github_next_urls", []).append(url)
-        metadata["last_updated"] = datetime.now(timezone.utc).isoformat()
-
-        with open(metadata_file, "w") as f:
-            json.dump(metadata, f, indent=2)
-
-        return True
-
-    def load_metadata():
-        """Fallback: Load metadata"""
-        metadata_file = Path(__file__).parent.parent / "data" / "metadata.json"
-        if metadata_file.exists():
-            with open(metadata_file) as f:
-                return json.load(f)
-        return {"github_next_urls": []}
-
     def ensure_dir(path: Path) -> None:
         """Ensure directory exists"""
         path.mkdir(parents=True, exist_ok=True)
@@ -76,6 +44,9 @@ except ImportError:
         path.write_text(content)
 
 
+from scripts.utils import conditional_get, record_http_validators
+
+
 # GitHub Next base URL
 GITHUB_NEXT_URL = "https://githubnext.com/"
 
@@ -83,23 +54,36 @@ GITHUB_NEXT_URL = "https://githubnext.com/"
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
 
-def fetch_github_next_projects() -> List[Dict]:
+def fetch_github_next_projects(
+    conditional: bool = True,
+) -> Tuple[Optional[List[Dict]], Optional[requests.Response]]:
     """
     Fetch GitHub Next projects by scraping the main page.
 
+    The page is requested conditionally (ETag / Last-Modified), so an
+    unchanged page is neither downloaded nor parsed again. The validators are
+    not recorded here: the caller records them with the returned response once
+    the projects are saved.
+
+    Args:
+        conditional: Set to False to force a full download, e.g. when no
+            project has been saved locally
+
     Returns:
-        List of parsed project entries
+        Tuple of (parsed project entries, or None if the page is unchanged
+        since the last run; the response they were parsed from, or None)
     """
     logger.info("Fetching GitHub Next projects...")
 
     try:
         # Fetch the main page
-        headers = {"User-Agent": "Mozilla/5.0 (compatible; GitHub-Copilot-Daily-Digest/1.0)"}
-        response = requests.get(
-            GITHUB_NEXT_URL, headers=headers, timeout=30, verify=certifi.where()
-        )
+        response = conditional_get(GITHUB_NEXT_URL, timeout=30, conditional=conditional)
         response.raise_for_status()
 
+        if response.status_code == 304:
+            logger.info("GitHub Next page unchanged since last run, skipping")
+            return None, None
+
         # Parse HTML
         soup = BeautifulSoup(response.text, "html.parser")
 
@@ -121,11 +105,11 @@ def fetch_github_next_projects() -> List[Dict]:
                 continue
 
         logger.info(f"Successfully parsed {len(projects)} projects")
-        return projects
+        return projects, response
 
     except Exception as e:
         logger.error(f"Failed to fetch GitHub Next projects: {e}")
-        return []
+        return [], None
 
 
 def parse_project_card(link_element) -> Optional[Dict]:
@@ -212,24 +196,25 @@ def save_project(project: Dict, output_dir: Path) -> bool:
         output_dir: Directory to save project data
 
     Returns:
-        True if saved (new project), False if skipped (duplicate)
+        True if saved (new or restored project), False if skipped (duplicate)
     """
     try:
         url = project["url"]
 
-        # Check if URL already processed
-        if not add_github_next_url(url):
-            logger.debug(f"Skipping duplicate: {url}")
-            return False
-
         # Generate filename from URL
         # e.g., /projects/copilot-radar/ -> copilot-radar.json
         url_slug = url.rstrip("/").split("/")[-1]
         filename = f"{url_slug}.json"
         filepath = output_dir / filename
 
+        # Check if URL already processed; a known project whose file is gone is saved again
+        if not add_github_next_url(url) and item_exists(output_dir, filename):
+            logger.debug(f"Skipping duplicate: {url}")
+            return False
+
         # Save full project data
         safe_write_file(filepath, json.dumps(project, indent=2))
+        record_item("github-next", filename, project)
         logger.info(f"Saved project: {filename}")
 
         return True
@@ -247,8 +232,14 @@ def main():
     output_dir = Path(__file__).parent.parent / "data" / "github-next"
     ensure_dir(output_dir)
 
-    # Fetch projects
-    projects = fetch_github_next_projects()
+    # Fetch projects; only revalidate when saved projects are still there,
+    # otherwise a 304 would leave nothing to restore them from
+    has_saved_projects = next(iter_items(output_dir), None) is not None
+    projects, response = fetch_github_next_projects(conditional=has_saved_projects)
+
+    if projects is None:
+        logger.info("No new projects (page unchanged)")
+        return
 
     if not projects:
         logger.warning("No projects fetched")
@@ -256,9 +247,14 @@ def main():
 
     # Save projects
     new_count = 0
-    for project in projects:
-        if save_project(project, output_dir):
-            new_count += 1
+    with metadata_session():
+        for project in projects:
+            if save_project(project, output_dir):
+                new_count += 1
+
+    # Record the validators only once the projects and metadata are written,
+    # so an interrupted run downloads the page again next time
+    record_http_validators(GITHUB_NEXT_URL, response)
 
     logger.info(f"Scraping complete: {new_count} new projects, {len(projects)} total")
 
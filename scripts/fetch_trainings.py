@@ -21,36 +21,14 @@ from typing import Dict, List
 # Add parent directory to path to import local modules
 sys.path.insert(0, str(Path(__file__).parent.parent.resolve()))
 
+from scripts.metadata import load_metadata, save_metadata
+from scripts.store import record_item
+
+
 try:
-    from scraper.metadata import load_metadata, save_metadata
     from scraper.utils import ensure_dir, safe_write_file
 except ImportError:
 
-    def load_metadata() -> dict:
-        """Fallback: Load metadata"""
-        metadata_file = Path(__file__).parent.parent / "data" / "metadata.json"
-        if metadata_file.exists():
-            with open(metadata_file) as f:
-                return json.load(f)
-        return {
-            "blog_urls": [],
-            "youtube_urls": [],
-            "training_ids": [],
-            "last_updated": None,
-        }
-
-    def save_metadata(metadata: dict) -> bool:
-        """Fallback: Save metadata"""
-        metadata_file = Path(__file__).parent.parent / "data" / "metadata.json"
-        metadata_file.parent.mkdir(parents=True, exist_ok=True)
-        try:
-            with open(metadata_file, "w") as f:
-                json.dump(metadata, f, indent=2)
-            return True
-        except Exception as e:
-            logging.error(f"Failed to save metadata: {e}")
-            return False
-
     def safe_write_file(filepath: Path, content: str) -> bool:
         """Fallback: Safely write file"""
         try:
@@ -305,6 +283,7 @@ def save_training(training: Dict) -> bool:
 
         if success:
             logger.info(f"✓ Saved: {training['title']}")
+            record_item("trainings", filepath.name, training)
         else:
             logger.error(f"✗ Failed to save: {training['title']}")
 
@@ -334,10 +313,7 @@ def update_metadata(trainings: List[Dict]) -> None:
         if training_id not in metadata["training_ids"]:
             metadata["training_ids"].append(training_id)
 
-    # Update last_updated timestamp
-    metadata["last_updated"] = datetime.now(timezone.utc).isoformat()
-
-    # Save metadata
+    # Save metadata (metadata.json or the SQLite store; stamps last_updated)
     save_metadata(metadata)
     logger.info(f"✓ Updated metadata with {len(trainings)} trainings")
 
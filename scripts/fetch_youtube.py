@@ -25,16 +25,17 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import List, Optional
 
-import certifi
-import feedparser
-import requests
 import yaml
 
 
 # Add parent directory to path to import local modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from scripts.metadata import add_video_id
+from scripts import archive
+from scripts.feeds import get_feed_entries
+from scripts.keywords import get_matcher
+from scripts.metadata import add_video_id, metadata_session
+from scripts.store import record_item
 from scripts.utils import ensure_directory, now_iso, parse_iso, safe_write_file
 
 
@@ -60,6 +61,9 @@ except ImportError:
 CONFIG_FILE = Path(__file__).parent.parent / "config" / "youtube.yml"
 DATA_DIR = Path(__file__).parent.parent / "data" / "videos"
 
+# Title keywords used when the config file does not list any
+DEFAULT_KEYWORDS = ["copilot", "ai", "agent"]
+
 
 def load_config() -> dict:
     """
@@ -93,6 +97,10 @@ def fetch_videos_rss(channel_id: str) -> List[dict]:
     RSS feed returns the last 15 videos from the channel.
     No API key required, no quota limits.
 
+    The feed goes through the shared snapshot cache (scripts/feeds.py), which
+    revalidates it with a conditional GET. Entries of an unchanged feed are
+    still returned; save_videos() skips the ones that are already saved.
+
     Args:
         channel_id: YouTube channel ID
 
@@ -104,24 +112,16 @@ def fetch_videos_rss(channel_id: str) -> List[dict]:
     logger.info(f"Fetching videos from RSS: {rss_url}")
 
     try:
-        # Use requests to fetch with proper SSL verification
-        response = requests.get(rss_url, timeout=30, verify=certifi.where())
-        response.raise_for_status()
-
-        # Parse the fetched content with feedparser
-        feed = feedparser.parse(response.content)
+        feed_entries = get_feed_entries(rss_url, revalidate=True)
 
-        if feed.bozo:
-            logger.warning(f"Feed parsing warning: {feed.get('bozo_exception', 'Unknown')}")
-
-        if not feed.entries:
+        if not feed_entries:
             logger.warning("No entries found in RSS feed")
             return []
 
-        logger.info(f"Found {len(feed.entries)} videos in RSS feed")
+        logger.info(f"Found {len(feed_entries)} videos in RSS feed")
 
         videos = []
-        for entry in feed.entries:
+        for entry in feed_entries:
             try:
                 video = parse_video_entry(entry, source="rss")
                 if video:
@@ -142,7 +142,7 @@ def parse_video_entry(entry, source: str = "rss") -> Optional[dict]:
     Parse video entry into structured format.
 
     Args:
-        entry: feedparser entry object (for RSS) or API response (for API)
+        entry: feed snapshot entry (for RSS) or API response (for API)
         source: Data source ("rss" or "api")
 
     Returns:
@@ -193,8 +193,8 @@ def parse_video_entry(entry, source: str = "rss") -> Optional[dict]:
 
             # Extract thumbnail URL
             thumbnail = ""
-            if "media_thumbnail" in entry and entry.media_thumbnail:
-                thumbnail = entry.media_thumbnail[0].get("url", "")
+            if entry.get("media_thumbnail"):
+                thumbnail = entry["media_thumbnail"][0].get("url", "")
 
             # Extract channel info
             channel_name = entry.get("author", "Unknown")
@@ -429,7 +429,7 @@ def enrich_with_api_data(videos: List[dict]) -> List[dict]:
 # ============================================================================
 
 
-def filter_copilot_videos(videos: List[dict]) -> List[dict]:
+def filter_copilot_videos(videos: List[dict], keywords: Optional[List[str]] = None) -> List[dict]:
     """
     Filter videos by Copilot-related keywords in title only.
     Uses word boundaries to avoid false positives (e.g., "ai" won't match "AirPods").
@@ -437,24 +437,19 @@ def filter_copilot_videos(videos: List[dict]) -> List[dict]:
 
     Args:
         videos: List of video dictionaries
+        keywords: Keywords to match (default: filters.keywords from the config file)
 
     Returns:
         Filtered list of Copilot-related videos
     """
-    config = load_config()
-    keywords = config.get("filters", {}).get("keywords", ["copilot", "ai", "agent"])
+    if keywords is None:
+        keywords = load_config().get("filters", {}).get("keywords", DEFAULT_KEYWORDS)
 
-    filtered = []
+    # All keywords compiled into one whole-word regex, built once per keyword list
+    matcher = get_matcher(tuple(keywords), whole_words=True)
 
-    for video in videos:
-        # Search only in title (more accurate filtering)
-        title = video.get("title", "").lower()
-
-        # Check if any keyword is present using word boundaries
-        # \b ensures we match whole words only (e.g., "ai" won't match "AirPods")
-        # s? handles plural forms (e.g., "agent" matches both "agent" and "agents")
-        if any(re.search(rf"\b{re.escape(keyword.lower())}s?\b", title) for keyword in keywords):
-            filtered.append(video)
+    # Search only in title (more accurate filtering)
+    filtered = [video for video in videos if matcher.search(video.get("title", ""))]
 
     logger.info(f"Filtered to {len(filtered)} Copilot-related videos from {len(videos)} total")
     return filtered
@@ -524,65 +519,83 @@ def save_videos(videos: List[dict], dry_run: bool = False) -> int:
     new_count = 0
     duplicate_count = 0
 
-    for video in videos:
-        video_id = video.get("video_id")
+    # Record all new IDs in memory and write metadata.json once at the end
+    with metadata_session():
+        for video in videos:
+            video_id = video.get("video_id")
 
-        if not video_id:
-            logger.warning("Video missing video_id, skipping")
-            continue
+            if not video_id:
+                logger.warning("Video missing video_id, skipping")
+                continue
 
-        # Check if already processed (skip duplicate check in dry-run to show all potential saves)
-        if not dry_run and not add_video_id(video_id):
-            duplicate_count += 1
-            logger.debug(f"Skipping duplicate video: {video_id}")
-            continue
+            # Check if already processed (skip duplicate check in dry-run to show all potential saves)
+            if not dry_run and not add_video_id(video_id):
+                duplicate_count += 1
+                logger.debug(f"Skipping duplicate video: {video_id}")
+                continue
 
-        # Extract date from published field
-        try:
-            published = video.get("published", "")
-            if published:
-                # Parse ISO date
-                dt = parse_iso(published)
-                date_part = dt.strftime("%Y-%m-%d")
-            else:
+            # Extract date from published field
+            try:
+                published = video.get("published", "")
+                if published:
+                    # Parse ISO date
+                    dt = parse_iso(published)
+                    date_part = dt.strftime("%Y-%m-%d")
+                else:
+                    date_part = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+            except Exception as e:
+                logger.warning(f"Failed to parse date for video {video_id}, using current date: {e}")
                 date_part = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        except Exception as e:
-            logger.warning(f"Failed to parse date for video {video_id}, using current date: {e}")
-            date_part = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-
-        # Create filename
-        filename = f"{date_part}_{video_id}.json"
-        filepath = DATA_DIR / filename
 
-        # Avoid filename collisions (shouldn't happen with video_id, but just in case)
-        counter = 1
-        while filepath.exists() and not dry_run:
-            filename = f"{date_part}_{video_id}_{counter}.json"
+            # Create filename
+            filename = f"{date_part}_{video_id}.json"
             filepath = DATA_DIR / filename
-            counter += 1
 
-        # Add scraped timestamp
-        video["scraped_at"] = now_iso()
-
-        if dry_run:
-            # In dry-run mode, just log what would be saved
-            logger.info(f"[DRY-RUN] Would save: {filename}")
-            logger.info(f"  Title: {video.get('title', 'N/A')}")
-            logger.info(f"  Published: {video.get('published', 'N/A')}")
-            new_count += 1
-        else:
-            # Write video data
-            try:
-                video_json = json.dumps(video, indent=2, ensure_ascii=False)
-                if safe_write_file(str(filepath), video_json):
-                    logger.info(f"Saved: {filename}")
-                    new_count += 1
-                else:
-                    logger.error(f"Failed to save: {filename}")
-            except Exception as e:
-                logger.error(f"Error saving video {filename}: {e}")
+            # Avoid filename collisions. A name already holding this video was saved
+            # by a run that failed before writing metadata; keep that copy.
+            counter = 1
+            already_saved = None
+            while not dry_run and archive.item_exists(DATA_DIR, filename):
+                existing = archive.get_item(DATA_DIR, filename) or {}
+                if existing.get("video_id") == video_id:
+                    already_saved = existing
+                    break
+                filename = f"{date_part}_{video_id}_{counter}.json"
+                filepath = DATA_DIR / filename
+                counter += 1
+            if already_saved is not None:
+                duplicate_count += 1
+                logger.info(f"Already saved as {filename}, recording it in metadata")
+                record_item("videos", filename, already_saved)
                 continue
 
+            # Add scraped timestamp
+            video["scraped_at"] = now_iso()
+
+            if dry_run:
+                # In dry-run mode, just log what would be saved
+                logger.info(f"[DRY-RUN] Would save: {filename}")
+                logger.info(f"  Title: {video.get('title', 'N/A')}")
+                logger.info(f"  Published: {video.get('published', 'N/A')}")
+                new_count += 1
+            else:
+                # Write video data (or append it to the JSONL archive)
+                try:
+                    if archive.is_enabled():
+                        saved = archive.append_item(DATA_DIR, filename, video)
+                    else:
+                        video_json = json.dumps(video, indent=2, ensure_ascii=False)
+                        saved = safe_write_file(str(filepath), video_json)
+                    if saved:
+                        logger.info(f"Saved: {filename}")
+                        record_item("videos", filename, video)
+                        new_count += 1
+                    else:
+                        logger.error(f"Failed to save: {filename}")
+                except Exception as e:
+                    logger.error(f"Error saving video {filename}: {e}")
+                    continue
+
     if not dry_run and duplicate_count > 0:
         logger.info(f"{duplicate_count} duplicates skipped")
 
@@ -751,7 +764,8 @@ def main():
 
     # Optionally filter by keywords
     if require_keywords:
-        all_videos = filter_copilot_videos(all_videos)
+        keywords = filters.get("keywords", DEFAULT_KEYWORDS)
+        all_videos = filter_copilot_videos(all_videos, keywords)
         if not all_videos:
             logger.warning("No videos remaining after keyword filtering")
             return 0
@@ -3,15 +3,28 @@
 Generate all content files from fresh data.
 This script reads data from data/ directory and generates content files.
 """
+import argparse
+import hashlib
+import html
 import json
+import math
 import re
-from datetime import datetime, timedelta
+import sys
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Optional
 
-import certifi
-import feedparser
-import requests
+from lxml import etree
+
+
+# Add parent directory to path to import local modules. scripts.feeds and
+# scripts.store pull in requests/feedparser/loguru, so they are imported where
+# used to keep an up-to-date (no-op) build fast.
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.keywords import KeywordMatcher
 
 
 # Base paths
@@ -24,46 +37,87 @@ GITHUB_BLOG_FEED = "https://github.blog/tag/github-copilot/feed/"
 GITHUB_CHANGELOG_FEED = "https://github.blog/changelog/feed/"
 GITHUB_COPILOT_CHANGELOG_FEED = "https://github.blog/changelog/label/copilot/feed/"
 
-def fetch_rss_content() -> Dict[str, Dict]:
+# Fingerprints of the inputs each page was last rendered from
+BUILD_MANIFEST = DATA_DIR / "build-manifest.json"
+
+# Content hashes of the files behind those fingerprints, reused while a file's
+# size and mtime are unchanged. Stat data differs on every checkout, so this
+# cache is local to the working copy (git-ignored); the manifest only holds
+# content hashes and stays valid across checkouts.
+FINGERPRINT_CACHE = DATA_DIR / "fingerprint-cache.json"
+
+# Structured history behind CHANGELOG.md: one JSON entry per line, keyed by URL
+CHANGELOG_INDEX = DATA_DIR / "changelog-index.jsonl"
+
+# Fields the pages read from each source. Blog post bodies are only needed
+# for the summaries on WHATS-NEW.md, so they are loaded for that window only.
+BLOG_FIELDS = ('title', 'url', 'published')
+BLOG_BODY_FIELDS = ('content', 'summary')
+VIDEO_FIELDS = ('title', 'url', 'published', 'description', 'channel_name', 'video_id')
+
+# Video categories in priority order: a video goes in the first category
+# whose keywords appear in its title or description
+VIDEO_CATEGORIES = [
+    ('Getting Started', ['getting started', 'intro', 'introduction', 'basics', 'beginner']),
+    ('Features & Updates', ['feature', 'announcement', 'release', 'introducing', "what's new"]),
+    ('Tutorials', ['tutorial', 'how to', 'guide', 'walkthrough', 'demo']),
+    ('Agents', ['agent', 'coding agent', 'workspace agent', 'autonomous', 'agentic']),
+    ('Extensions', ['extension', 'plugin', 'integration', 'api', 'vscode', 'jetbrains']),
+]
+VIDEO_CATEGORY_MATCHER = KeywordMatcher(kw for _, keywords in VIDEO_CATEGORIES for kw in keywords)
+
+# CHANGELOG layouts: one file grouped by month, or an index page plus one
+# file per month under content/changelog/
+CHANGELOG_LAYOUTS = ["single", "monthly"]
+CHANGELOG_ARCHIVE_DIR = "changelog"
+
+# Pages whose content changed in the last build, for later stages
+CHANGED_PAGES_FILE = DATA_DIR / "changed-pages.json"
+
+# Inputs of each generated page, relative to DATA_DIR (data/blog includes
+# url_dates.json, data/feeds the RSS snapshots). Every page also depends on
+# the build date (its "Last Updated" line and the 7/30-day windows) and on
+# this script itself.
+PAGE_INPUTS = {
+    "README.md": ["blog", "videos", "trainings", "github-next", "feeds"],
+    "WHATS-NEW.md": ["blog", "videos", "feeds"],
+    "VIDEOS.md": ["videos", "metadata.json"],
+    "TRAININGS.md": ["trainings"],
+    "EXPERIMENTAL.md": ["github-next"],
+    "CHANGELOG.md": ["blog", "videos", "feeds", "changelog-index.jsonl"],
+}
+
+# With DIGEST_STORE=sqlite, items and metadata are also read from the store;
+# its WAL file holds the writes that are not checkpointed into digest.db yet
+STORE_INPUTS = ["digest.db", "digest.db-wal"]
+
+def pages_need_all_videos(pages: Iterable[str]) -> bool:
+    """Check whether any of the pages lists videos beyond the 30-day window."""
+    return any(page in pages for page in ("README.md", "VIDEOS.md", "CHANGELOG.md"))
+
+def fetch_rss_content(offline: bool = False) -> Dict[str, Dict]:
     """
     Fetch current blog content from RSS feeds to supplement missing data files.
     Returns a dictionary mapping URLs to blog post data with full content.
+
+    Feeds come from the shared snapshot in data/feeds/, so feeds already
+    downloaded by fetch_blog.py in this run are not downloaded again. With
+    offline=True only the saved snapshots are read, whatever their age.
     """
+    from scripts.feeds import get_feed_entries
+
     blog_content = {}
 
     try:
-        # Fetch GitHub Blog RSS
-        response = requests.get(GITHUB_BLOG_FEED, timeout=30, verify=certifi.where())
-        feed = feedparser.parse(response.content)
-
-        for entry in feed.entries:
-            url = entry.get('link', '').strip()
-            if url:
-                # Extract content
-                content = ""
-                if 'content' in entry and entry.content:
-                    content = entry.content[0].get('value', '') if isinstance(entry.content, list) else entry.content.get('value', '')
-
-                blog_content[url] = {
-                    'title': entry.get('title', '').strip(),
-                    'url': url,
-                    'summary': entry.get('summary', '').strip(),
-                    'content': content,
-                    'published': entry.get('published', '')
-                }
-
-        # Fetch Copilot-specific changelog first (pre-filtered by GitHub label),
-        # then fall back to general changelog for any additional entries.
-        for feed_url in [GITHUB_COPILOT_CHANGELOG_FEED, GITHUB_CHANGELOG_FEED]:
-            response = requests.get(feed_url, timeout=30, verify=certifi.where())
-            feed = feedparser.parse(response.content)
-
-            for entry in feed.entries:
+        # GitHub Blog first, then the Copilot-specific changelog (pre-filtered by
+        # GitHub label), then the general changelog for any additional entries.
+        for feed_url in [GITHUB_BLOG_FEED, GITHUB_COPILOT_CHANGELOG_FEED, GITHUB_CHANGELOG_FEED]:
+            for entry in get_feed_entries(feed_url, offline=offline):
                 url = entry.get('link', '').strip()
                 if url and url not in blog_content:
                     content = ""
-                    if 'content' in entry and entry.content:
-                        content = entry.content[0].get('value', '') if isinstance(entry.content, list) else entry.content.get('value', '')
+                    if entry.get('content'):
+                        content = entry['content'][0].get('value', '') if isinstance(entry['content'], list) else entry['content'].get('value', '')
 
                     blog_content[url] = {
                         'title': entry.get('title', '').strip(),
@@ -83,14 +137,226 @@ def load_json(filepath: Path) -> Dict:
         return json.load(f)
 
 def load_all_json_in_dir(directory: Path) -> List[Dict]:
-    """Load all JSON files in a directory."""
-    items = []
-    if directory.exists():
-        for file in directory.glob("*.json"):
-            if file.name != "url_dates.json":
-                items.append(load_json(file))
-    return items
+    """Load all items of a data directory, whatever its layout (see scripts/archive.py)."""
+    return list(iter_json_in_dir(directory))
+
+def iter_json_in_dir(
+    directory: Path, fields: Optional[Iterable[str]] = None, since_days: Optional[int] = None
+) -> Iterator[Dict]:
+    """
+    Lazily load the items of a data directory, one at a time.
+
+    With `fields`, each item is cut down to those keys as soon as it is
+    read, so heavy fields (e.g. blog post HTML) are not kept in memory.
+    Projected items remember their file under '_file'; hydrate() loads the
+    remaining fields back for the few items that need them.
+
+    With `since_days` and DIGEST_STORE=sqlite, only items published in that
+    window are read, through the store's date index; other backends still
+    yield every item, so callers filter by date themselves.
+    """
+    from scripts import archive, store
+
+    if since_days is not None and store.is_enabled():
+        items = store.get_store().iter_items_since(directory.name, since_days)
+    else:
+        items = archive.iter_items(directory)
+    for filename, item in items:
+        if fields is not None:
+            item = {key: item[key] for key in fields if key in item}
+            item['_file'] = filename
+        yield item
+
+def hydrate(items: List[Dict], directory: Path, fields: Iterable[str]) -> None:
+    """Load `fields` into projected items (see iter_json_in_dir) from their files."""
+    from scripts import archive
+
+    for item in items:
+        filename = item.get('_file')
+        if not filename:
+            continue
+        full = archive.get_item(directory, filename) or {}
+        for key in fields:
+            if key in full:
+                item.setdefault(key, full[key])
+
+# Loaded on first use; entries used in this run are written back by save_fingerprint_cache()
+_fingerprint_cache: Optional[Dict[str, Dict[str, str]]] = None
+_fingerprint_cache_loaded: Dict[str, Dict[str, str]] = {}
+_fingerprint_cache_used: Dict[str, Dict[str, str]] = {}
+
+def hash_file(path: Path) -> str:
+    """Hash a file's content, reusing the cached hash while its size and mtime are unchanged."""
+    global _fingerprint_cache, _fingerprint_cache_loaded
+    if _fingerprint_cache is None:
+        try:
+            _fingerprint_cache_loaded = load_json(FINGERPRINT_CACHE)
+        except (OSError, json.JSONDecodeError):
+            _fingerprint_cache_loaded = {}
+        _fingerprint_cache = dict(_fingerprint_cache_loaded)
+
+    stat = path.stat()
+    key = path.as_posix()
+    signature = f"{stat.st_size}:{stat.st_mtime_ns}"
+    entry = _fingerprint_cache.get(key)
+    if not entry or entry.get('stat') != signature:
+        hasher = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                hasher.update(chunk)
+        entry = {'stat': signature, 'hash': hasher.hexdigest()}
+        _fingerprint_cache[key] = entry
+    _fingerprint_cache_used[key] = entry
+    return entry['hash']
+
+def save_fingerprint_cache() -> None:
+    """Write the entries used in this run to the fingerprint cache, if they changed."""
+    if _fingerprint_cache_used == _fingerprint_cache_loaded:
+        return
+    temp_path = FINGERPRINT_CACHE.with_suffix('.tmp')
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(_fingerprint_cache_used, f, indent=2, sort_keys=True)
+    temp_path.replace(FINGERPRINT_CACHE)
+
+def fingerprint_path(path: Path) -> str:
+    """
+    Fingerprint a file or directory from its content.
+
+    Directories are fingerprinted from the names and content hashes of their
+    files (including archive segments in subdirectories). Unchanged files are
+    not read again (see hash_file()), and a fresh checkout of the same data
+    gives the same fingerprints.
+    """
+    if path.is_dir():
+        entries = sorted(
+            (entry.relative_to(path).as_posix(), hash_file(entry))
+            for entry in path.rglob('*')
+            if entry.is_file()
+        )
+        return hashlib.sha256(json.dumps(entries).encode('utf-8')).hexdigest()
+    if path.exists():
+        return hash_file(path)
+    return "missing"
+
+def page_inputs() -> Dict[str, List[str]]:
+    """Get PAGE_INPUTS, plus the SQLite store for pages that read items or metadata from it."""
+    from scripts import store
+
+    if not store.is_enabled():
+        return PAGE_INPUTS
+    store_backed = set(store.SOURCES) | {"metadata.json"}
+    return {
+        page: names + STORE_INPUTS if store_backed & set(names) else names
+        for page, names in PAGE_INPUTS.items()
+    }
+
+def page_fingerprints(build_date: str, options: Dict = None) -> Dict[str, str]:
+    """Compute the input fingerprint of every page for a build date and render options."""
+    inputs_by_page = page_inputs()
+    inputs = {name for names in inputs_by_page.values() for name in names}
+    path_fingerprints = {name: fingerprint_path(DATA_DIR / name) for name in inputs}
+    script_fingerprint = fingerprint_path(Path(__file__))
+
+    fingerprints = {}
+    for page, names in inputs_by_page.items():
+        key = json.dumps({
+            'inputs': {name: path_fingerprints[name] for name in names},
+            'date': build_date,
+            'options': options or {},
+            'script': script_fingerprint,
+        }, sort_keys=True)
+        fingerprints[page] = hashlib.sha256(key.encode('utf-8')).hexdigest()
+    return fingerprints
+
+def load_build_manifest() -> Dict[str, Dict]:
+    """Load the build manifest (page -> input fingerprint and output stat)."""
+    try:
+        return load_json(BUILD_MANIFEST)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+def save_build_manifest(manifest: Dict[str, Dict]) -> None:
+    """Write the build manifest atomically."""
+    temp_path = BUILD_MANIFEST.with_suffix('.tmp')
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    temp_path.replace(BUILD_MANIFEST)
+
+def save_changed_pages(pages: List[str]) -> None:
+    """Write data/changed-pages.json atomically, unless it already lists exactly these pages."""
+    if CHANGED_PAGES_FILE.exists() and load_json(CHANGED_PAGES_FILE) == pages:
+        return
+    temp_path = CHANGED_PAGES_FILE.with_suffix('.tmp')
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(pages, f, indent=2)
+    temp_path.replace(CHANGED_PAGES_FILE)
+
+def stale_pages(manifest: Dict[str, Dict], fingerprints: Dict[str, str]) -> List[str]:
+    """
+    List the pages that need rendering.
+
+    A page is stale if its inputs changed since it was last rendered, or if
+    the output file is missing or was modified outside this script.
+    """
+    stale = []
+    for page, fingerprint in fingerprints.items():
+        entry = manifest.get(page, {})
+        if (entry.get('inputs') != fingerprint
+                or entry.get('output') != fingerprint_path(CONTENT_DIR / page)):
+            stale.append(page)
+    return stale
+
+# Pages written by write_page() during this run
+changed_pages: List[str] = []
+
+def write_page(filename: str, content: str) -> bool:
+    """
+    Write a content page, but only if it differs from the file on disk.
+
+    The rendered content is compared by hash against the existing file and
+    written atomically (temp file + rename) only on a real change, so
+    unchanged pages keep their mtime and produce no git diff. Written pages
+    are recorded in changed_pages.
+
+    Returns True if the file was written.
+    """
+    path = CONTENT_DIR / filename
+    data = (content.strip() + '\n').encode('utf-8')
+    if path.exists() and hashlib.sha256(path.read_bytes()).digest() == hashlib.sha256(data).digest():
+        return False
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + '.tmp')
+    temp_path.write_bytes(data)
+    temp_path.replace(path)
+    changed_pages.append(filename)
+    return True
+
+@lru_cache(maxsize=None)
+def parse_timestamp(date_str: str) -> int:
+    """Parse an ISO date once into epoch seconds (dates without a timezone are UTC)."""
+    dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+def sort_newest_first(items: List[Dict], date_key: str) -> List[int]:
+    """
+    Sort items newest first by an ISO date field, parsing each date once.
 
+    Returns the negated epoch of every item, in the same (ascending) order,
+    for published_since to bisect.
+    """
+    keys = [-parse_timestamp(item[date_key]) for item in items]
+    order = sorted(range(len(items)), key=keys.__getitem__)
+    items[:] = [items[i] for i in order]
+    return [keys[i] for i in order]
+
+def published_since(items: List[Dict], keys: List[int], cutoff: datetime) -> List[Dict]:
+    """Get the items published at or after cutoff, in O(log n) (see sort_newest_first)."""
+    return items[:bisect_right(keys, -math.ceil(cutoff.timestamp()))]
+
+@lru_cache(maxsize=None)
 def format_date(date_str: str) -> str:
     """Format ISO date to 'Month Day, Year' (e.g., 'Feb 2, 2026')."""
     dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
@@ -99,49 +365,70 @@ def format_date(date_str: str) -> str:
 
 def get_video_category(video: Dict) -> str:
     """Categorize video based on title and description."""
-    text = (video.get('title', '') + ' ' + video.get('description', '')).lower()
+    text = video.get('title', '') + ' ' + video.get('description', '')
+    matched = VIDEO_CATEGORY_MATCHER.matches(text)
 
     # Check in priority order
-    if any(kw in text for kw in ['getting started', 'intro', 'introduction', 'basics', 'beginner']):
-        return 'Getting Started'
-    if any(kw in text for kw in ['feature', 'announcement', 'release', 'introducing', "what's new"]):
-        return 'Features & Updates'
-    if any(kw in text for kw in ['tutorial', 'how to', 'guide', 'walkthrough', 'demo']):
-        return 'Tutorials'
-    if any(kw in text for kw in ['agent', 'coding agent', 'workspace agent', 'autonomous', 'agentic']):
-        return 'Agents'
-    if any(kw in text for kw in ['extension', 'plugin', 'integration', 'api', 'vscode', 'jetbrains']):
-        return 'Extensions'
+    for category, keywords in VIDEO_CATEGORIES:
+        if matched.intersection(keywords):
+            return category
     return 'Other'
 
-def clean_html(text: str) -> str:
-    """Remove HTML tags and clean up text."""
-    # Remove HTML heading elements entirely (they become noise after stripping)
-    text = re.sub(r'<h[1-6][^>]*>.*?</h[1-6]>', ' ', text, flags=re.IGNORECASE | re.DOTALL)
-    # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
-    # Clean up HTML entities
-    text = text.replace('&nbsp;', ' ').replace('&#8217;', "'").replace('&mdash;', '—')
-    text = text.replace('&ldquo;', '"').replace('&rdquo;', '"')
-    text = text.replace('&amp;', '&').replace('&rsquo;', "'")
-    # Remove common section-heading fragments that become noise after HTML stripping
-    # These originate from <h2>/<h3> headings in blog posts that lack punctuation.
-    heading_fragments = [
-        r'\bHow it works\b',
-        r"\bWhat's changed\b",
-        r"\bWhat's new\b",
-        r'\bWhy it matters\b',
-        r'\bNext steps\b',
-        r'Learn more about\b',
-        r'\bLearn more\b',
-    ]
-    for fragment in heading_fragments:
-        text = re.sub(fragment, '', text, flags=re.IGNORECASE)
+# Section-heading fragments that become noise after HTML stripping. These
+# originate from <h2>/<h3> headings in blog posts that lack punctuation.
+HEADING_FRAGMENTS = re.compile(
+    r"\b(?:learn more(?: about)?|how it works|what's (?:changed|new)|why it matters|next steps)\b",
+    re.IGNORECASE,
+)
+
+HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+
+# libxml2's HTML parser: decodes every named and numeric entity, and
+# tolerates the broken markup found in feed bodies. It is fed UTF-8 bytes,
+# because lxml rejects str input that starts with an encoding declaration
+HTML_PARSER = etree.HTMLParser(encoding='utf-8')
+
+def html_to_text(text: str) -> str:
+    """Remove HTML tags and headings, decode entities and clean up whitespace.
+
+    The result is plain text, not yet safe for Markdown; cut it to length
+    first, then escape it (see clean_html()).
+    """
+    if not text.strip():
+        return ''
+    root = etree.fromstring(text.encode('utf-8'), HTML_PARSER)
+    if root is None:
+        return ''
+    # Drop headings entirely (they become noise after stripping), leaving a
+    # space so the text around them does not run together
+    for heading in root.iter(*HEADING_TAGS):
+        heading.tail = ' ' + (heading.tail or '')
+    etree.strip_elements(root, *HEADING_TAGS, with_tail=False)
+    text = etree.tostring(root, method='text', encoding=str)
+    # Typographic quotes become plain ASCII, tabs and non-breaking spaces plain spaces
+    text = text.replace('\u2019', "'").replace('\u201c', '"').replace('\u201d', '"')
+    text = text.replace('\t', ' ').replace('\xa0', ' ')
+    text = HEADING_FRAGMENTS.sub('', text)
     # Collapse multiple whitespace/newlines introduced by removals
-    text = re.sub(r'[ \t]+', ' ', text)
+    text = re.sub(r' {2,}', ' ', text)
     text = re.sub(r'\n{2,}', '\n', text)
     return text.strip()
 
+def escape_markdown_text(text: str) -> str:
+    """Escape <, > and & in plain text for the pages.
+
+    Decoded &lt;/&gt; would otherwise become raw HTML in the pages
+    (an escaped "&lt;!--" turns into a comment that hides the rest of the page).
+    """
+    return html.escape(text, quote=False)
+
+def clean_html(text: str) -> str:
+    """Remove HTML tags, headings and entities, and clean up whitespace.
+
+    The result is Markdown-safe: <, > and & are escaped again after decoding.
+    """
+    return escape_markdown_text(html_to_text(text))
+
 def extract_readable_summary(blog_post: Dict) -> str:
     """
     Extract a clean, journalistic summary from a blog post.
@@ -155,9 +442,10 @@ def extract_readable_summary(blog_post: Dict) -> str:
     content = blog_post.get('content', '')
     summary = blog_post.get('summary', '')
 
-    # Clean HTML from content
-    clean_content = clean_html(content) if content else ''
-    clean_summary = clean_html(summary) if summary else ''
+    # Clean HTML from content; lengths are measured on the plain text,
+    # which is escaped only once the summary is chosen
+    clean_content = html_to_text(content) if content else ''
+    clean_summary = html_to_text(summary) if summary else ''
 
     # Remove the RSS boilerplate from summary
     if clean_summary:
@@ -190,29 +478,29 @@ def extract_readable_summary(blog_post: Dict) -> str:
                 break
 
         if result and len(result) >= 2:
-            return ' '.join(result)
+            return escape_markdown_text(' '.join(result))
         if result and len(result) == 1 and len(result[0]) > 100:
             # If we only got 1 sentence but it's substantial, use it
-            return result[0]
+            return escape_markdown_text(result[0])
 
     # Fallback to cleaned summary if it exists and is substantial
     if clean_summary and len(clean_summary) > 50:
         # Make sure it's not just a title repetition
         title = blog_post.get('title', '')
         if title.lower() not in clean_summary.lower() or len(clean_summary) > len(title) + 20:
-            return clean_summary
+            return escape_markdown_text(clean_summary)
 
     # Last resort: return title with a note
     title = blog_post.get('title', 'this update')
     return f"Explore the latest update: {title}."
 
 def clean_video_description(description: str, max_length: int = 200) -> str:
-    """Clean and truncate video description."""
+    """Clean and truncate video description (truncated as plain text, then escaped)."""
     if not description:
         return ""
 
-    # Clean HTML
-    clean_desc = clean_html(description)
+    # Clean HTML; escaping comes last so the cut never lands inside an entity
+    clean_desc = html_to_text(description)
 
     # Truncate at sentence boundary if possible
     if len(clean_desc) > max_length:
@@ -224,36 +512,79 @@ def clean_video_description(description: str, max_length: int = 200) -> str:
         last_sentence_end = max(last_period, last_exclaim, last_question)
 
         if last_sentence_end > max_length * 0.6:  # If we found a good break point
-            return clean_desc[:last_sentence_end + 1]
+            return escape_markdown_text(clean_desc[:last_sentence_end + 1])
         # Otherwise truncate at word boundary
         truncated = clean_desc[:max_length].rsplit(' ', 1)[0]
-        return truncated + "..."
+        return escape_markdown_text(truncated) + "..."
+
+    return escape_markdown_text(clean_desc)
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Generate content/*.md from data/")
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Render every page, even if its inputs are unchanged since the last build'
+    )
+    parser.add_argument(
+        '--offline',
+        action='store_true',
+        help='Render from local data and saved feed snapshots only, without network access'
+    )
+    parser.add_argument(
+        '--changelog-layout',
+        choices=CHANGELOG_LAYOUTS,
+        default='single',
+        help='single: one CHANGELOG.md grouped by month (default); '
+             'monthly: CHANGELOG.md index plus one page per month in content/changelog/'
+    )
+    return parser.parse_args()
+
+def main(force: bool = False, offline: bool = False, changelog_layout: str = "single"):
+    """
+    Generate the content files whose inputs changed since the last build.
+
+    With offline=True the RSS supplement comes only from the feed snapshots
+    saved by the fetch stage, so rendering never touches the network.
+    """
 
-    return clean_desc
+    # Get current timestamp (timezone-aware)
+    now = datetime.now(timezone.utc)
+    last_updated = now.strftime('%B %d, %Y')
 
-def main():
-    """Generate all content files."""
+    # Work out which pages are out of date before loading anything
+    options = {'changelog_layout': changelog_layout}
+    manifest = load_build_manifest()
+    pages = list(PAGE_INPUTS) if force else stale_pages(manifest, page_fingerprints(last_updated, options))
+    if not pages:
+        print("Content is up to date, nothing to generate.")
+        # Nothing changed in this run; don't leave the last run's list behind
+        save_changed_pages([])
+        save_fingerprint_cache()
+        return
 
     # Load data
     print("Loading data...")
     url_dates = load_json(DATA_DIR / "blog" / "url_dates.json")
 
     # Fetch current RSS content to supplement blog data
-    print("Fetching fresh RSS content...")
-    rss_content = fetch_rss_content()
+    print("Reading saved RSS snapshots..." if offline else "Fetching fresh RSS content...")
+    rss_content = fetch_rss_content(offline=offline)
     print(f"Fetched {len(rss_content)} blog posts from RSS")
 
-    # Load all data files
-    blog_posts = load_all_json_in_dir(DATA_DIR / "blog")
-    videos = load_all_json_in_dir(DATA_DIR / "videos")
+    # Load all data files. WHATS-NEW.md only needs the last 30 days of videos,
+    # so when no other page using videos is stale, read just that window
+    video_days = None if pages_need_all_videos(pages) else 30
+    blog_posts = list(iter_json_in_dir(DATA_DIR / "blog", BLOG_FIELDS))
+    videos = list(iter_json_in_dir(DATA_DIR / "videos", VIDEO_FIELDS, since_days=video_days))
     trainings = load_all_json_in_dir(DATA_DIR / "trainings")
     github_next = load_all_json_in_dir(DATA_DIR / "github-next")
 
     # Load metadata for cumulative counts (e.g. total videos tracked over all time)
-    metadata = {}
-    metadata_path = DATA_DIR / "metadata.json"
-    if metadata_path.exists():
-        metadata = load_json(metadata_path)
+    from scripts.metadata import read_metadata
+
+    metadata = read_metadata()
 
     def _title_from_url(url: str) -> str:
         """Extract a readable title from a URL slug, stripping date prefixes."""
@@ -279,16 +610,8 @@ def main():
                     'content': ''
                 })
     else:
-        # Enrich existing blog posts with RSS content
+        # Add posts from url_dates.json that aren't covered by existing JSON files
         existing_urls = {post.get('url', '') for post in blog_posts}
-        for post in blog_posts:
-            url = post.get('url', '')
-            if url in rss_content and not post.get('content'):
-                post['content'] = rss_content[url].get('content', '')
-                if not post.get('summary'):
-                    post['summary'] = rss_content[url].get('summary', '')
-
-        # Also add posts from url_dates.json that aren't covered by existing JSON files
         for url, _date_str in url_dates['url_dates'].items():
             if url not in existing_urls:
                 if url in rss_content:
@@ -303,7 +626,7 @@ def main():
                     })
 
     # Sort videos by date (newest first)
-    videos.sort(key=lambda x: x.get('published', ''), reverse=True)
+    video_keys = sort_newest_first(videos, 'published')
 
     # Sort blog posts by date (newest first)
     blog_posts_with_dates = []
@@ -313,23 +636,26 @@ def main():
         if date_str:
             post['date_iso'] = date_str
             blog_posts_with_dates.append(post)
-    blog_posts_with_dates.sort(key=lambda x: x.get('date_iso', ''), reverse=True)
-
-    # Get current timestamp (timezone-aware)
-    from datetime import timezone
-    now = datetime.now(timezone.utc)
-    last_updated = now.strftime('%B %d, %Y')
+    blog_keys = sort_newest_first(blog_posts_with_dates, 'date_iso')
 
     # Calculate 7 and 30 days ago
     seven_days_ago = now - timedelta(days=7)
     thirty_days_ago = now - timedelta(days=30)
 
-    # Filter recent items
-    from datetime import timezone
-    recent_videos_7d = [v for v in videos if datetime.fromisoformat(v['published'].replace('Z', '+00:00')) >= seven_days_ago]
-    recent_videos_30d = [v for v in videos if datetime.fromisoformat(v['published'].replace('Z', '+00:00')) >= thirty_days_ago]
-    recent_blog_7d = [p for p in blog_posts_with_dates if datetime.fromisoformat(p['date_iso']).replace(tzinfo=timezone.utc) >= seven_days_ago]
-    recent_blog_30d = [p for p in blog_posts_with_dates if datetime.fromisoformat(p['date_iso']).replace(tzinfo=timezone.utc) >= thirty_days_ago]
+    # Filter recent items (newest-first prefixes of the sorted lists)
+    recent_videos_7d = published_since(videos, video_keys, seven_days_ago)
+    recent_videos_30d = published_since(videos, video_keys, thirty_days_ago)
+    recent_blog_7d = published_since(blog_posts_with_dates, blog_keys, seven_days_ago)
+    recent_blog_30d = published_since(blog_posts_with_dates, blog_keys, thirty_days_ago)
+
+    # Load post bodies for the summaries, enriching them with RSS content
+    hydrate(recent_blog_30d, DATA_DIR / "blog", BLOG_BODY_FIELDS)
+    for post in recent_blog_30d:
+        url = post.get('url', '')
+        if url in rss_content and not post.get('content'):
+            post['content'] = rss_content[url].get('content', '')
+            if not post.get('summary'):
+                post['summary'] = rss_content[url].get('summary', '')
 
     print(f"Total blog posts: {len(blog_posts_with_dates)}")
     print(f"Total videos: {len(videos)}")
@@ -342,23 +668,47 @@ def main():
     print("\nGenerating content files...")
 
     # Generate README.md
-    generate_readme(blog_posts_with_dates, videos, trainings, github_next, last_updated)
+    if "README.md" in pages:
+        generate_readme(blog_posts_with_dates, videos, trainings, github_next, last_updated)
 
     # Generate WHATS-NEW.md
-    generate_whats_new(recent_blog_7d, recent_blog_30d, recent_videos_7d, recent_videos_30d, url_dates, last_updated)
+    if "WHATS-NEW.md" in pages:
+        generate_whats_new(recent_blog_7d, recent_blog_30d, recent_videos_7d, recent_videos_30d, url_dates, last_updated)
 
     # Generate VIDEOS.md
-    total_videos_tracked = len(metadata.get('video_ids', [])) or len(videos)
-    generate_videos(videos, last_updated, total_videos_tracked)
+    if "VIDEOS.md" in pages:
+        total_videos_tracked = len(metadata.get('video_ids', [])) or len(videos)
+        generate_videos(videos, last_updated, total_videos_tracked, recent_videos_30d)
 
     # Generate TRAININGS.md
-    generate_trainings(trainings, last_updated)
+    if "TRAININGS.md" in pages:
+        generate_trainings(trainings, last_updated)
 
     # Generate EXPERIMENTAL.md
-    generate_experimental(github_next, last_updated)
+    if "EXPERIMENTAL.md" in pages:
+        generate_experimental(github_next, last_updated)
 
     # Generate CHANGELOG.md
-    generate_changelog(blog_posts_with_dates, videos, url_dates, last_updated)
+    if "CHANGELOG.md" in pages:
+        generate_changelog(blog_posts_with_dates, videos, url_dates, last_updated, changelog_layout)
+
+    # Record what the pages were rendered from. Fingerprints are taken after
+    # loading, so feed snapshots refreshed during this run count as seen.
+    fingerprints = page_fingerprints(last_updated, options)
+    for page in pages:
+        manifest[page] = {
+            'inputs': fingerprints[page],
+            'output': fingerprint_path(CONTENT_DIR / page),
+        }
+    save_build_manifest(manifest)
+    save_fingerprint_cache()
+
+    # Report which pages actually changed so later stages can skip the rest
+    save_changed_pages(changed_pages)
+    if changed_pages:
+        print(f"\nChanged pages: {', '.join(changed_pages)}")
+    else:
+        print("\nAll rendered pages are unchanged.")
 
     print("\nContent generation complete!")
 
@@ -401,8 +751,7 @@ Welcome to your daily, modular, and up-to-date resource for all things GitHub Co
 _Last updated: {last_updated}_
 """
 
-    with open(CONTENT_DIR / "README.md", 'w', encoding='utf-8') as f:
-        f.write(content.strip() + '\n')
+    write_page("README.md", content)
 
 def generate_whats_new(blog_7d, blog_30d, videos_7d, videos_30d, url_dates, last_updated):
     """Generate WHATS-NEW.md."""
@@ -538,11 +887,10 @@ See [CHANGELOG.md](CHANGELOG.md) for the full historical timeline.
 _All dates are complete and sorted newest first. For a full list of updates, see [CHANGELOG.md](CHANGELOG.md)._
 """
 
-    with open(CONTENT_DIR / "WHATS-NEW.md", 'w', encoding='utf-8') as f:
-        f.write(content.strip() + '\n')
+    write_page("WHATS-NEW.md", content)
 
-def generate_videos(videos, last_updated, total_videos_tracked=None):
-    """Generate VIDEOS.md."""
+def generate_videos(videos, last_updated, total_videos_tracked=None, recent_videos=None):
+    """Generate VIDEOS.md (recent_videos: the last 30 days, if already selected)."""
     print("  - VIDEOS.md")
 
     # Categorize videos
@@ -557,10 +905,9 @@ def generate_videos(videos, last_updated, total_videos_tracked=None):
     category_counts = {cat: len(vids) for cat, vids in categorized.items()}
 
     # Recent videos (last 30 days)
-    from datetime import timezone
-    now = datetime.now(timezone.utc)
-    thirty_days_ago = now - timedelta(days=30)
-    recent_videos = [v for v in videos if datetime.fromisoformat(v['published'].replace('Z', '+00:00')) >= thirty_days_ago]
+    if recent_videos is None:
+        thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
+        recent_videos = [v for v in videos if parse_timestamp(v['published']) >= thirty_days_ago.timestamp()]
 
     # Use metadata-tracked total if available, otherwise fall back to current data count
     display_total = total_videos_tracked if total_videos_tracked is not None else len(videos)
@@ -663,8 +1010,7 @@ def generate_videos(videos, last_updated, total_videos_tracked=None):
 - [Back to Digest Home](README.md)
 """
 
-    with open(CONTENT_DIR / "VIDEOS.md", 'w', encoding='utf-8') as f:
-        f.write(content.strip() + '\n')
+    write_page("VIDEOS.md", content)
 
 def generate_trainings(trainings, last_updated):
     """Generate TRAININGS.md."""
@@ -783,8 +1129,7 @@ Master GitHub Copilot with these official courses, certifications, and curated l
 - [Back to Digest Home](README.md)
 """
 
-    with open(CONTENT_DIR / "TRAININGS.md", 'w', encoding='utf-8') as f:
-        f.write(content.strip() + '\n')
+    write_page("TRAININGS.md", content)
 
 def generate_experimental(github_next, last_updated):
     """Generate EXPERIMENTAL.md."""
@@ -853,18 +1198,161 @@ They do not represent official product roadmap.
 *Remember: These are experimental prototypes exploring future possibilities, not official product features.*
 """
 
-    with open(CONTENT_DIR / "EXPERIMENTAL.md", 'w', encoding='utf-8') as f:
-        f.write(content.strip() + '\n')
+    write_page("EXPERIMENTAL.md", content)
+
+def parse_changelog_entries(content: str) -> List[Dict]:
+    """Recover (date, type, title, url) entries from rendered CHANGELOG.md text."""
+    items = []
+    # Match lines like: - **Mar 14, 2026** - [Title](url) (Type)
+    entry_pattern = re.compile(
+        r'- \*\*([A-Za-z]+ \d+, \d{4})\*\* - \[([^\]]+)\]\(([^)]+)\) \((\w+)\)'
+    )
+    month_map = {m: i for i, m in enumerate(
+        ['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec'], 1
+    )}
+    for match in entry_pattern.finditer(content):
+        date_str, title, url, entry_type = match.groups()
+        # Parse "Mar 14, 2026" -> "2026-03-14"
+        try:
+            parts = date_str.replace(',', '').split()
+            if len(parts) == 3:
+                month_num = month_map.get(parts[0][:3], 0)
+                if month_num:
+                    iso_date = f"{parts[2]}-{month_num:02d}-{int(parts[1]):02d}"
+                    items.append({
+                        'date': iso_date,
+                        'type': entry_type,
+                        'title': title,
+                        'url': url
+                    })
+        except (ValueError, IndexError):
+            pass
+    return items
+
+def load_changelog_index() -> Dict[str, Dict]:
+    """
+    Load the changelog sidecar index (data/changelog-index.jsonl), keyed by URL.
+
+    The first time, the index is bootstrapped from the entries in the
+    existing CHANGELOG.md; after that the markdown is never re-parsed.
+    """
+    index = {}
+    if CHANGELOG_INDEX.exists():
+        with open(CHANGELOG_INDEX, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    item = json.loads(line)
+                    index.setdefault(item['url'], item)
+        return index
+
+    changelog_path = CONTENT_DIR / "CHANGELOG.md"
+    if changelog_path.exists():
+        entries = parse_changelog_entries(changelog_path.read_text(encoding='utf-8'))
+        for item in entries:
+            index.setdefault(item['url'], item)
+        append_changelog_index(list(index.values()))
+    return index
+
+def append_changelog_index(items: List[Dict]) -> None:
+    """Append entries to the changelog sidecar index."""
+    if not items:
+        return
+    with open(CHANGELOG_INDEX, 'a', encoding='utf-8') as f:
+        for item in items:
+            f.write(json.dumps(item, ensure_ascii=False) + '\n')
+
+def split_changelog_sections(content: str) -> Dict[str, str]:
+    """Split rendered CHANGELOG.md text into month sections keyed by YYYY-MM."""
+    sections = {}
+    headings = list(re.finditer(r'^## (.+)$', content, flags=re.MULTILINE))
+    footer_start = content.rfind('---\n\n_For recent updates')
+    for i, heading in enumerate(headings):
+        end = headings[i + 1].start() if i + 1 < len(headings) else footer_start
+        if end < heading.start():
+            continue
+        try:
+            month_key = datetime.strptime(heading.group(1).strip(), '%B %Y').strftime('%Y-%m')
+        except ValueError:
+            continue
+        sections[month_key] = content[heading.start():end]
+    return sections
+
+def changelog_month_name(month_key: str) -> str:
+    """Turn 'YYYY-MM' into 'Month YYYY'."""
+    year, month = month_key.split('-')
+    return datetime(int(year), int(month), 1).strftime('%B %Y')
+
+def render_changelog_month(month_key: str, items: List[Dict]) -> str:
+    """Render one month section of CHANGELOG.md (items newest first)."""
+    section = f"## {changelog_month_name(month_key)}\n\n"
+    for item in sorted(items, key=lambda x: x['date'], reverse=True):
+        date_formatted = format_date(item['date'])
+        section += f"- **{date_formatted}** - [{item['title']}]({item['url']}) ({item['type']})\n"
+    return section + "\n"
+
+def generate_changelog_archive(by_month, affected_months, last_updated):
+    """
+    Generate CHANGELOG.md as an index page plus one page per month.
+
+    Month pages live in content/changelog/YYYY-MM.md. Finished months are
+    frozen: they are only rendered if their page is missing or new items
+    were backfilled into them. The current month is rendered every time.
+    """
+    current_month = datetime.now(timezone.utc).strftime('%Y-%m')
+
+    for month_key, items in by_month.items():
+        filename = f"{CHANGELOG_ARCHIVE_DIR}/{month_key}.md"
+        if (month_key >= current_month or month_key in affected_months
+                or not (CONTENT_DIR / filename).exists()):
+            page = f"""# GitHub Copilot Changelog: {changelog_month_name(month_key)}
+
+> Part of the [complete changelog](../CHANGELOG.md)
+
+"""
+            page += render_changelog_month(month_key, items)
+            write_page(filename, page)
+
+    content = f"""# GitHub Copilot Changelog
+
+> Complete historical timeline of features, updates, and improvements
+
+**Last Updated**: {last_updated}
+
+This page indexes the complete history of GitHub Copilot updates tracked by this repository, one page per month. For recent updates (last 30 days), see [WHATS-NEW.md](WHATS-NEW.md).
+
+---
+
+"""
+
+    for month_key in sorted(by_month.keys(), reverse=True):
+        count = len(by_month[month_key])
+        content += f"- [{changelog_month_name(month_key)}]({CHANGELOG_ARCHIVE_DIR}/{month_key}.md) ({count} update{'s' if count != 1 else ''})\n"
+
+    content += """
+---
+
+_For recent updates, see [WHATS-NEW.md](WHATS-NEW.md)._
+"""
+
+    write_page("CHANGELOG.md", content)
+
+def generate_changelog(blog_posts, videos, url_dates, last_updated, layout="single"):
+    """
+    Generate CHANGELOG.md, preserving all historical entries.
 
-def generate_changelog(blog_posts, videos, url_dates, last_updated):
-    """Generate CHANGELOG.md, preserving all historical entries."""
+    History lives in the sidecar index (data/changelog-index.jsonl); only
+    items whose URL is not indexed yet are appended, and only the month
+    sections they fall in are re-rendered. Other months are reused verbatim
+    from the existing CHANGELOG.md. With layout="monthly" the history is
+    split into one page per month (see generate_changelog_archive).
+    """
     print("  - CHANGELOG.md")
 
-    # Combine new blog and video items
-    new_items = []
+    # Combine current blog and video items
+    current_items = []
 
     for post in blog_posts:
-        new_items.append({
+        current_items.append({
             'date': post['date_iso'],
             'type': 'Blog',
             'title': post['title'],
@@ -872,61 +1360,37 @@ def generate_changelog(blog_posts, videos, url_dates, last_updated):
         })
 
     for video in videos:
-        new_items.append({
+        current_items.append({
             'date': video['published'][:10],
             'type': 'Video',
             'title': video['title'],
             'url': video['url']
         })
 
-    # Parse existing CHANGELOG.md to extract historical entries
-    existing_items = []
-    changelog_path = CONTENT_DIR / "CHANGELOG.md"
-    if changelog_path.exists():
-        existing_content = changelog_path.read_text(encoding='utf-8')
-        # Match lines like: - **Mar 14, 2026** - [Title](url) (Type)
-        entry_pattern = re.compile(
-            r'- \*\*([A-Za-z]+ \d+, \d{4})\*\* - \[([^\]]+)\]\(([^)]+)\) \((\w+)\)'
-        )
-        month_map = {m: i for i, m in enumerate(
-            ['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec'], 1
-        )}
-        for match in entry_pattern.finditer(existing_content):
-            date_str, title, url, entry_type = match.groups()
-            # Parse "Mar 14, 2026" -> "2026-03-14"
-            try:
-                parts = date_str.replace(',', '').split()
-                if len(parts) == 3:
-                    month_num = month_map.get(parts[0][:3], 0)
-                    if month_num:
-                        iso_date = f"{parts[2]}-{month_num:02d}-{int(parts[1]):02d}"
-                        existing_items.append({
-                            'date': iso_date,
-                            'type': entry_type,
-                            'title': title,
-                            'url': url
-                        })
-            except (ValueError, IndexError):
-                pass
-
-    # Merge: existing items + new items, deduplicated by URL
-    seen_urls = set()
-    all_items = []
-    for item in existing_items + new_items:
-        if item['url'] not in seen_urls:
-            seen_urls.add(item['url'])
-            all_items.append(item)
-
-    # Sort by date (newest first)
-    all_items.sort(key=lambda x: x['date'], reverse=True)
+    # Merge: indexed history wins, new URLs are appended to the index
+    index = load_changelog_index()
+    new_items = []
+    for item in current_items:
+        if item['url'] not in index:
+            index[item['url']] = item
+            new_items.append(item)
+    append_changelog_index(new_items)
 
     # Group by month
     by_month = {}
-    for item in all_items:
-        month_key = item['date'][:7]  # YYYY-MM
-        if month_key not in by_month:
-            by_month[month_key] = []
-        by_month[month_key].append(item)
+    for item in index.values():
+        by_month.setdefault(item['date'][:7], []).append(item)  # YYYY-MM
+
+    affected_months = {item['date'][:7] for item in new_items}
+    if layout == "monthly":
+        generate_changelog_archive(by_month, affected_months, last_updated)
+        return
+
+    # Reuse rendered sections of months without new items
+    changelog_path = CONTENT_DIR / "CHANGELOG.md"
+    existing_sections = {}
+    if changelog_path.exists():
+        existing_sections = split_changelog_sections(changelog_path.read_text(encoding='utf-8'))
 
     content = f"""# GitHub Copilot Changelog
 
@@ -942,27 +1406,18 @@ This file contains the complete history of GitHub Copilot updates tracked by thi
 
     # Generate month sections (newest first)
     for month_key in sorted(by_month.keys(), reverse=True):
-        items = by_month[month_key]
-
-        # Parse month
-        year, month = month_key.split('-')
-        month_name = datetime(int(year), int(month), 1).strftime('%B %Y')
-
-        content += f"## {month_name}\n\n"
-
-        for item in items:
-            date_formatted = format_date(item['date'])
-            content += f"- **{date_formatted}** - [{item['title']}]({item['url']}) ({item['type']})\n"
-
-        content += "\n"
+        if month_key in existing_sections and month_key not in affected_months:
+            content += existing_sections[month_key]
+        else:
+            content += render_changelog_month(month_key, by_month[month_key])
 
     content += """---
 
 _For recent updates, see [WHATS-NEW.md](WHATS-NEW.md)._
 """
 
-    with open(CONTENT_DIR / "CHANGELOG.md", 'w', encoding='utf-8') as f:
-        f.write(content.strip() + '\n')
+    write_page("CHANGELOG.md", content)
 
 if __name__ == '__main__':
-    main()
+    args = parse_arguments()
+    main(force=args.force, offline=args.offline, changelog_layout=args.changelog_layout)
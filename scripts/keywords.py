@@ -0,0 +1,124 @@
+"""
+Precompiled keyword matching shared by the fetchers and the content generator.
+
+A KeywordMatcher compiles a whole keyword list into a single alternation
+regex, so checking a text costs one scan instead of one scan (or one regex
+compilation) per keyword. It supports the two matching styles used in this
+project:
+
+- substring matching (`"ai" in text`), used for blog filtering and video
+  categories
+- whole-word matching with optional plural "s" (`\\bagent(s)?\\b`), used for
+  the YouTube title filter
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, Pattern, Set, Tuple
+
+
+class KeywordMatcher:
+    """
+    Case-insensitive multi-keyword matcher built once from a keyword list.
+
+    Example:
+        matcher = KeywordMatcher(["copilot", "agent"], whole_words=True)
+        matcher.search("Copilot agents in action")   # True
+        matcher.matches("Copilot agents in action")  # {"copilot", "agent"}
+    """
+
+    def __init__(self, keywords: Iterable[str], whole_words: bool = False):
+        """
+        Compile the matcher.
+
+        Args:
+            keywords: Keywords to look for (matched case-insensitively)
+            whole_words: Match whole words only, allowing a plural "s"
+                (e.g. "ai" does not match "AirPods", "agent" matches "agents")
+        """
+        # Longest first, so the alternation prefers "coding agent" over "agent"
+        self.keywords: Tuple[str, ...] = tuple(
+            sorted({kw.lower() for kw in keywords if kw}, key=len, reverse=True)
+        )
+        self.whole_words = whole_words
+
+        alternation = "|".join(re.escape(kw) for kw in self.keywords)
+        if whole_words:
+            alternation = rf"\b(?:{alternation})s?\b"
+        # Never matches when there are no keywords
+        self._search: Pattern = re.compile(alternation or r"(?!)", re.IGNORECASE)
+        # Zero-width lookahead so matches starting at every position are found,
+        # including keywords that overlap an earlier match
+        self._scan: Pattern = re.compile(
+            rf"(?=({alternation}))" if alternation else r"(?!)", re.IGNORECASE
+        )
+
+        # A match of keyword A also contains every keyword B that matches inside
+        # A itself (e.g. "coding agent" contains "agent"); the lookahead only
+        # reports the longest keyword at each position, so add those back
+        self._implied = {
+            kw: {
+                other for other in self.keywords if other != kw and self._matches_within(other, kw)
+            }
+            for kw in self.keywords
+        }
+
+    def _matches_within(self, keyword: str, text: str) -> bool:
+        """Check whether `keyword` matches inside `text` under this matcher's rules."""
+        if self.whole_words:
+            return re.search(rf"\b{re.escape(keyword)}s?\b", text) is not None
+        return keyword in text
+
+    def _keyword_of(self, matched: str) -> str:
+        """Map matched text (any case, maybe pluralized) back to its keyword."""
+        matched = matched.lower()
+        if self.whole_words and matched not in self._implied and matched.endswith("s"):
+            return matched[:-1]
+        return matched
+
+    def search(self, text: str) -> bool:
+        """
+        Check whether any keyword occurs in the text.
+
+        Args:
+            text: Text to check
+
+        Returns:
+            bool: True if at least one keyword matches
+        """
+        return bool(text) and self._search.search(text) is not None
+
+    def matches(self, text: str) -> Set[str]:
+        """
+        Find every keyword that occurs in the text, in one pass.
+
+        Args:
+            text: Text to check
+
+        Returns:
+            set: Matched keywords, lowercased as in the keyword list
+        """
+        found: Set[str] = set()
+        if not text:
+            return found
+        for match in self._scan.finditer(text):
+            keyword = self._keyword_of(match.group(1))
+            if keyword not in found:
+                found.add(keyword)
+                found |= self._implied.get(keyword, set())
+        return found
+
+
+@lru_cache(maxsize=None)
+def get_matcher(keywords: Tuple[str, ...], whole_words: bool = False) -> KeywordMatcher:
+    """
+    Get a cached matcher for a keyword tuple.
+
+    Args:
+        keywords: Keywords to look for (a tuple, so it can be cached)
+        whole_words: Match whole words only, allowing a plural "s"
+
+    Returns:
+        KeywordMatcher: Compiled once per distinct keyword list
+    """
+    return KeywordMatcher(keywords, whole_words=whole_words)
@@ -8,15 +8,19 @@ This module provides functions to:
 - Maintain version history for documentation
 """
 
+import copy
 import difflib
 import hashlib
 import json
+import os
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Dict, Iterator, Optional, Set
 
 
-METADATA_FILE = "data/metadata.json"
-METADATA_BACKUP = "data/metadata.backup.json"
+METADATA_FILE = str(Path(__file__).parent.parent / "data" / "metadata.json")
+METADATA_BACKUP = str(Path(__file__).parent.parent / "data" / "metadata.backup.json")
 
 DEFAULT_METADATA = {
     "version": "1.0.0",
@@ -35,17 +39,85 @@ DEFAULT_METADATA = {
     },
 }
 
+# Metadata of the active metadata_session(), if any
+_session: Optional[dict] = None
+
+# In-memory dedup indexes: metadata list key ("video_ids", "blog_urls",
+# "github_next_urls") -> set of its values. Built once per process from the
+# lists in metadata.json and kept in sync by the add_* functions.
+_dedup_indexes: Dict[str, Set[str]] = {}
+
+
+def _sqlite_store():
+    """
+    Get the SQLite store if DIGEST_STORE=sqlite, otherwise None.
+
+    Imported lazily so the default JSON backend has no extra dependencies.
+    """
+    if os.environ.get("DIGEST_STORE", "json").lower() != "sqlite":
+        return None
+    from scripts.store import get_store
+
+    return get_store()
+
+
+def read_metadata() -> dict:
+    """
+    Read metadata without any side effects, for tools that only read it.
+
+    Unlike load_metadata(), a missing metadata.json is not created and a
+    corrupted one is neither backed up nor replaced; defaults are returned
+    instead, and the file is left for a writer to repair.
+
+    Returns:
+        dict: The metadata dictionary (from the SQLite store with DIGEST_STORE=sqlite)
+    """
+    if _session is not None:
+        return _session
+
+    store = _sqlite_store()
+    if store is not None:
+        metadata = store.load_metadata()
+    else:
+        try:
+            with open(METADATA_FILE, encoding="utf-8") as f:
+                metadata = json.load(f)
+            if not isinstance(metadata, dict):
+                raise ValueError("Metadata is not a dictionary")
+        except FileNotFoundError:
+            metadata = {}
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable metadata.json: {e}")
+            metadata = {}
+
+    for key in DEFAULT_METADATA:
+        if key not in metadata:
+            metadata[key] = copy.deepcopy(DEFAULT_METADATA[key])
+    return metadata
+
 
 def load_metadata() -> dict:
     """
-    Load metadata from data/metadata.json.
+    Load metadata from data/metadata.json, for writers.
 
     Creates a new metadata file with defaults if it doesn't exist.
     If the file is corrupted, backs it up and creates a new one.
+    Read-only tools use read_metadata() instead.
 
     Returns:
         dict: The metadata dictionary
     """
+    if _session is not None:
+        return _session
+
+    store = _sqlite_store()
+    if store is not None:
+        metadata = store.load_metadata()
+        for key in DEFAULT_METADATA:
+            if key not in metadata:
+                metadata[key] = copy.deepcopy(DEFAULT_METADATA[key])
+        return metadata
+
     metadata_path = Path(METADATA_FILE)
 
     # Ensure data directory exists
@@ -53,7 +125,7 @@ def load_metadata() -> dict:
 
     if not metadata_path.exists():
         # Create new metadata file with defaults
-        metadata = DEFAULT_METADATA.copy()
+        metadata = copy.deepcopy(DEFAULT_METADATA)
         save_metadata(metadata)
         return metadata
 
@@ -80,7 +152,8 @@ def load_metadata() -> dict:
             metadata_path.rename(backup_path)
             print(f"Backed up corrupted metadata to {METADATA_BACKUP}")
 
-        metadata = DEFAULT_METADATA.copy()
+        _dedup_indexes.clear()
+        metadata = copy.deepcopy(DEFAULT_METADATA)
         save_metadata(metadata)
         return metadata
 
@@ -89,22 +162,82 @@ def save_metadata(metadata: dict) -> None:
     """
     Save metadata to data/metadata.json.
 
-    Updates the last_updated timestamp automatically.
+    Updates the last_updated timestamp automatically. The file is written
+    atomically (temp file + rename), or to the SQLite store in one
+    transaction when DIGEST_STORE=sqlite. Inside a metadata_session() this is a
+    no-op; the session writes once when it ends.
 
     Args:
         metadata: The metadata dictionary to save
     """
+    if _session is not None:
+        return
+
+    # Update last_updated timestamp
+    metadata["last_updated"] = get_current_timestamp()
+
+    store = _sqlite_store()
+    if store is not None:
+        store.save_metadata(metadata)
+        return
+
     metadata_path = Path(METADATA_FILE)
 
     # Ensure data directory exists
     metadata_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Update last_updated timestamp
-    metadata["last_updated"] = get_current_timestamp()
-
-    # Write to file with pretty formatting
-    with open(metadata_path, "w", encoding="utf-8") as f:
+    # Write to a temp file with pretty formatting, then swap it in
+    temp_path = metadata_path.with_suffix(".tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
         json.dump(metadata, f, indent=2, ensure_ascii=False)
+    temp_path.replace(metadata_path)
+
+
+@contextmanager
+def metadata_session() -> Iterator[dict]:
+    """
+    Batch metadata updates into a single load and a single write.
+
+    While the session is active, load_metadata() returns the same in-memory
+    dictionary and save_metadata() defers, so loops over add_video_id(),
+    add_blog_url(), update_content_hash() etc. no longer rewrite
+    metadata.json per item. On normal exit the metadata is saved once,
+    atomically. If the block raises, nothing is written and the file on
+    disk is left exactly as it was. Item files written before the failure
+    stay on disk; the fetchers' save loops recognise them on the next run
+    (same file name and URL / video ID) and record them instead of saving a
+    duplicate. Nested sessions join the outer one.
+
+    Example:
+        with metadata_session():
+            for post in posts:
+                add_blog_url(post["url"])
+
+    Yields:
+        dict: The metadata dictionary shared by the session
+    """
+    global _session
+    if _session is not None:
+        yield _session
+        return
+
+    metadata = load_metadata()
+    _session = metadata
+    try:
+        yield metadata
+    except BaseException:
+        # Drop index entries for values that are not going to be saved
+        _dedup_indexes.clear()
+        raise
+    finally:
+        _session = None
+
+    # Only reached if the block completed without raising
+    try:
+        save_metadata(metadata)
+    except BaseException:
+        _dedup_indexes.clear()
+        raise
 
 
 def calculate_hash(content: str) -> str:
@@ -170,7 +303,7 @@ def is_content_changed(file_path: str, content: str) -> bool:
     Returns:
         bool: True if content has changed or is new, False otherwise
     """
-    metadata = load_metadata()
+    metadata = read_metadata()
     current_hash = calculate_hash(content)
 
     if file_path not in metadata["content_hashes"]:
@@ -181,6 +314,48 @@ def is_content_changed(file_path: str, content: str) -> bool:
     return current_hash != previous_hash
 
 
+def get_dedup_index(metadata: dict, key: str) -> Set[str]:
+    """
+    Get the set index for one of the append-only metadata lists.
+
+    The set is built from metadata[key] on first use and reused for the rest
+    of the process, so membership checks are O(1) instead of a scan over
+    the list. On disk the list stays the source of truth.
+
+    Args:
+        metadata: The metadata dictionary
+        key: List key ("video_ids", "blog_urls" or "github_next_urls")
+
+    Returns:
+        set: Values already recorded under the key
+    """
+    if key not in _dedup_indexes:
+        _dedup_indexes[key] = set(metadata.setdefault(key, []))
+    return _dedup_indexes[key]
+
+
+def _add_unique(metadata: dict, key: str, value: str) -> bool:
+    """
+    Append a value to a metadata list unless it is already recorded.
+
+    Args:
+        metadata: The metadata dictionary
+        key: List key ("video_ids", "blog_urls" or "github_next_urls")
+        value: Value to add
+
+    Returns:
+        bool: True if the value is new, False if it already exists
+    """
+    index = get_dedup_index(metadata, key)
+    if value in index:
+        # Duplicate
+        return False
+
+    metadata.setdefault(key, []).append(value)
+    index.add(value)
+    return True
+
+
 def add_video_id(video_id: str) -> bool:
     """
     Add video ID to metadata.
@@ -193,12 +368,10 @@ def add_video_id(video_id: str) -> bool:
     """
     metadata = load_metadata()
 
-    if video_id in metadata["video_ids"]:
-        # Duplicate
+    if not _add_unique(metadata, "video_ids", video_id):
         return False
 
     # New video ID
-    metadata["video_ids"].append(video_id)
     metadata["stats"]["total_videos"] = len(metadata["video_ids"])
     save_metadata(metadata)
     return True
@@ -216,12 +389,10 @@ def add_blog_url(url: str) -> bool:
     """
     metadata = load_metadata()
 
-    if url in metadata["blog_urls"]:
-        # Duplicate
+    if not _add_unique(metadata, "blog_urls", url):
         return False
 
     # New blog URL
-    metadata["blog_urls"].append(url)
     metadata["stats"]["total_blog_posts"] = len(metadata["blog_urls"])
     save_metadata(metadata)
     return True
@@ -241,19 +412,10 @@ def add_github_next_url(url: str) -> bool:
     """
     metadata = load_metadata()
 
-    # Ensure github_next_urls key exists (for backwards compatibility)
-    if "github_next_urls" not in metadata:
-        metadata["github_next_urls"] = []
-
-    if "total_github_next_projects" not in metadata["stats"]:
-        metadata["stats"]["total_github_next_projects"] = 0
-
-    if url in metadata["github_next_urls"]:
-        # Duplicate
+    if not _add_unique(metadata, "github_next_urls", url):
         return False
 
     # New GitHub Next URL
-    metadata["github_next_urls"].append(url)
     metadata["stats"]["total_github_next_projects"] = len(metadata["github_next_urls"])
     save_metadata(metadata)
     return True
@@ -339,7 +501,7 @@ def get_changes_summary() -> dict:
     Returns:
         dict: Summary containing counts of new and changed content
     """
-    metadata = load_metadata()
+    metadata = read_metadata()
 
     return {
         "last_updated": metadata.get("last_updated"),
@@ -421,7 +583,8 @@ def reset_metadata() -> None:
         print(f"Backed up metadata to {METADATA_BACKUP}")
 
     # Create fresh metadata
-    metadata = DEFAULT_METADATA.copy()
+    _dedup_indexes.clear()
+    metadata = copy.deepcopy(DEFAULT_METADATA)
     save_metadata(metadata)
     print("Metadata reset to defaults")
 
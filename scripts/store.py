@@ -0,0 +1,459 @@
+"""
+Optional SQLite storage backend for metadata and content items.
+
+By default the pipeline keeps its state in data/metadata.json and one JSON
+file per item under data/blog, data/videos, data/trainings and
+data/github-next. Setting DIGEST_STORE=sqlite switches to a single SQLite
+database (data/digest.db, WAL mode) that holds:
+
+- metadata   - the scalar parts of metadata.json (content_hashes, stats, ...)
+- seen       - the append-only dedup lists (video_ids, blog_urls, ...)
+- items      - every content item, indexed by url, video_id, source and
+               published date
+
+The JSON files are still written by the fetchers, so the filesystem layout
+stays available; `python scripts/store.py export` rebuilds it from the
+database and `python scripts/store.py import` loads an existing tree.
+
+Usage:
+    DIGEST_STORE=sqlite python scripts/store.py import
+    python scripts/store.py export
+    python scripts/store.py recent --days 7
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+# Add parent directory to path to import local modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from scripts.utils import ensure_directory, safe_write_file
+
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+STORE_FILE = DATA_DIR / "digest.db"
+
+# Backend selection: "json" (default, metadata.json + item files) or "sqlite"
+STORE_BACKEND = os.environ.get("DIGEST_STORE", "json").lower()
+
+# Item sources, named after their directory under data/
+SOURCES = ("blog", "videos", "trainings", "github-next")
+
+# Metadata keys stored as rows of the seen table instead of JSON blobs
+SEEN_KEYS = ("video_ids", "blog_urls", "github_next_urls", "training_ids")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS seen (
+    kind  TEXT NOT NULL,
+    value TEXT NOT NULL,
+    seq   INTEGER PRIMARY KEY AUTOINCREMENT,
+    UNIQUE (kind, value)
+);
+CREATE TABLE IF NOT EXISTS items (
+    source    TEXT NOT NULL,
+    filename  TEXT NOT NULL,
+    url       TEXT,
+    video_id  TEXT,
+    published TEXT,
+    data      TEXT NOT NULL,
+    PRIMARY KEY (source, filename)
+);
+CREATE INDEX IF NOT EXISTS idx_items_url ON items (url);
+CREATE INDEX IF NOT EXISTS idx_items_video_id ON items (video_id);
+CREATE INDEX IF NOT EXISTS idx_items_source_published ON items (source, published);
+"""
+
+
+def is_enabled() -> bool:
+    """
+    Check whether the SQLite backend is selected (DIGEST_STORE=sqlite).
+
+    Returns:
+        bool: True if the SQLite store should be used
+    """
+    return STORE_BACKEND == "sqlite"
+
+
+def published_of(item: Dict[str, Any]) -> Optional[str]:
+    """
+    Get the publication timestamp of an item, whatever its source.
+
+    Blog posts and videos use "published", GitHub Next projects use "date".
+
+    Args:
+        item: Content item dictionary
+
+    Returns:
+        ISO 8601 string, or None if the item has no date
+    """
+    return item.get("published") or item.get("date") or None
+
+
+class DigestStore:
+    """
+    SQLite-backed store for metadata and content items.
+
+    One connection per instance; every public method commits its own
+    transaction. Use as a context manager to close the connection.
+    """
+
+    def __init__(self, path: Path = STORE_FILE):
+        ensure_directory(str(Path(path).parent))
+        self.path = Path(path)
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self) -> "DigestStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    # ------------------------------------------------------------------
+    # Metadata (same shape as data/metadata.json)
+    # ------------------------------------------------------------------
+
+    def load_metadata(self) -> Dict[str, Any]:
+        """
+        Load the metadata dictionary.
+
+        Returns:
+            dict: Metadata in the metadata.json layout (empty if never saved)
+        """
+        metadata = {
+            key: json.loads(value)
+            for key, value in self.conn.execute("SELECT key, value FROM metadata")
+        }
+        for key in SEEN_KEYS:
+            rows = self.conn.execute("SELECT value FROM seen WHERE kind = ? ORDER BY seq", (key,))
+            metadata[key] = [row[0] for row in rows]
+        return metadata
+
+    def save_metadata(self, metadata: Dict[str, Any]) -> None:
+        """
+        Save the metadata dictionary in one transaction.
+
+        Dedup lists are merged into the seen table (they are append-only);
+        every other key replaces its stored value.
+
+        Args:
+            metadata: Metadata in the metadata.json layout
+        """
+        with self.conn:
+            for key, value in metadata.items():
+                if key in SEEN_KEYS:
+                    self.conn.executemany(
+                        "INSERT OR IGNORE INTO seen (kind, value) VALUES (?, ?)",
+                        ((key, item) for item in value),
+                    )
+                else:
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+                        (key, json.dumps(value, ensure_ascii=False)),
+                    )
+
+    def add_seen(self, kind: str, value: str) -> bool:
+        """
+        Record a value in one of the dedup lists.
+
+        Args:
+            kind: List key ("video_ids", "blog_urls", ...)
+            value: Value to add
+
+        Returns:
+            bool: True if the value is new, False if it already exists
+        """
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO seen (kind, value) VALUES (?, ?)", (kind, value)
+            )
+        return cursor.rowcount == 1
+
+    def has_seen(self, kind: str, value: str) -> bool:
+        """
+        Check whether a value is in one of the dedup lists.
+
+        Args:
+            kind: List key ("video_ids", "blog_urls", ...)
+            value: Value to look up
+
+        Returns:
+            bool: True if the value was recorded before
+        """
+        row = self.conn.execute(
+            "SELECT 1 FROM seen WHERE kind = ? AND value = ?", (kind, value)
+        ).fetchone()
+        return row is not None
+
+    # ------------------------------------------------------------------
+    # Content items
+    # ------------------------------------------------------------------
+
+    def upsert_item(self, source: str, filename: str, item: Dict[str, Any]) -> None:
+        """
+        Insert or replace a content item.
+
+        Args:
+            source: Source name (directory under data/, e.g. "videos")
+            filename: File name of the item in the filesystem layout
+            item: Item dictionary
+        """
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO items (source, filename, url, video_id, published, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    source,
+                    filename,
+                    item.get("url"),
+                    item.get("video_id"),
+                    published_of(item),
+                    json.dumps(item, ensure_ascii=False),
+                ),
+            )
+
+    def load_items(self, source: str) -> List[Dict[str, Any]]:
+        """
+        Load every item of a source (replacement for a directory scan).
+
+        Args:
+            source: Source name (directory under data/, e.g. "videos")
+
+        Returns:
+            List of item dictionaries, ordered by file name
+        """
+        rows = self.conn.execute(
+            "SELECT data FROM items WHERE source = ? ORDER BY filename", (source,)
+        )
+        return [json.loads(row[0]) for row in rows]
+
+    def iter_items(self, source: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Iterate over the items of a source without loading them all at once.
+
+        Args:
+            source: Source name (directory under data/, e.g. "videos")
+
+        Yields:
+            Tuples of (file name, item dictionary), ordered by file name
+        """
+        rows = self.conn.execute(
+            "SELECT filename, data FROM items WHERE source = ? ORDER BY filename", (source,)
+        )
+        for filename, data in rows:
+            yield filename, json.loads(data)
+
+    def get_item(self, source: str, filename: str) -> Optional[Dict[str, Any]]:
+        """
+        Load one item by source and file name.
+
+        Args:
+            source: Source name (directory under data/, e.g. "videos")
+            filename: File name of the item in the filesystem layout
+
+        Returns:
+            Item dictionary, or None if the item is unknown
+        """
+        row = self.conn.execute(
+            "SELECT data FROM items WHERE source = ? AND filename = ?", (source, filename)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def iter_items_since(self, source: str, days: int) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Iterate over the items of a source published in the last N days.
+
+        Uses the (source, published) index instead of reading every item.
+
+        Args:
+            source: Source name (directory under data/, e.g. "videos")
+            days: Window size in days
+
+        Yields:
+            Tuples of (file name, item dictionary), newest first
+        """
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%dT%H:%M:%S")
+        rows = self.conn.execute(
+            "SELECT filename, data FROM items WHERE source = ? AND published >= ? "
+            "ORDER BY published DESC",
+            (source, cutoff),
+        )
+        for filename, data in rows:
+            yield filename, json.loads(data)
+
+    def items_since(self, source: str, days: int) -> List[Dict[str, Any]]:
+        """
+        Load the items of a source published in the last N days.
+
+        Args:
+            source: Source name (directory under data/, e.g. "videos")
+            days: Window size in days
+
+        Returns:
+            List of item dictionaries, newest first
+        """
+        return [item for _, item in self.iter_items_since(source, days)]
+
+    def find_by_url(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up an item by URL.
+
+        Args:
+            url: Item URL
+
+        Returns:
+            Item dictionary, or None if no item has that URL
+        """
+        row = self.conn.execute("SELECT data FROM items WHERE url = ? LIMIT 1", (url,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def find_by_video_id(self, video_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a video by YouTube video ID.
+
+        Args:
+            video_id: YouTube video ID
+
+        Returns:
+            Video dictionary, or None if the video is unknown
+        """
+        row = self.conn.execute(
+            "SELECT data FROM items WHERE video_id = ? LIMIT 1", (video_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    # ------------------------------------------------------------------
+    # Filesystem import / export
+    # ------------------------------------------------------------------
+
+    def import_filesystem(self, data_dir: Path = DATA_DIR) -> int:
+        """
+        Load metadata.json and all item files into the database.
+
+        Args:
+            data_dir: Root of the filesystem layout
+
+        Returns:
+            int: Number of items imported
+        """
+        metadata_path = data_dir / "metadata.json"
+        if metadata_path.exists():
+            with open(metadata_path, encoding="utf-8") as f:
+                self.save_metadata(json.load(f))
+
+        count = 0
+        for source in SOURCES:
+            directory = data_dir / source
+            if not directory.exists():
+                continue
+            for file in sorted(directory.glob("*.json")):
+                if file.name == "url_dates.json":
+                    continue
+                try:
+                    with open(file, encoding="utf-8") as f:
+                        self.upsert_item(source, file.name, json.load(f))
+                    count += 1
+                except (OSError, json.JSONDecodeError) as e:
+                    logger.warning(f"Skipping unreadable item {file}: {e}")
+        return count
+
+    def export_filesystem(self, data_dir: Path = DATA_DIR) -> int:
+        """
+        Write metadata.json and all item files from the database.
+
+        Args:
+            data_dir: Root of the filesystem layout
+
+        Returns:
+            int: Number of items exported
+        """
+        safe_write_file(
+            str(data_dir / "metadata.json"),
+            json.dumps(self.load_metadata(), indent=2, ensure_ascii=False),
+        )
+
+        count = 0
+        for source, filename, data in self.conn.execute("SELECT source, filename, data FROM items"):
+            item_json = json.dumps(json.loads(data), indent=2, ensure_ascii=False)
+            if safe_write_file(str(data_dir / source / filename), item_json):
+                count += 1
+        return count
+
+
+_store: Optional[DigestStore] = None
+
+
+def get_store() -> DigestStore:
+    """
+    Get the process-wide store instance.
+
+    Returns:
+        DigestStore: Shared store opened on STORE_FILE
+    """
+    global _store
+    if _store is None:
+        _store = DigestStore()
+    return _store
+
+
+def record_item(source: str, filename: str, item: Dict[str, Any]) -> None:
+    """
+    Mirror an item file into the store, if the SQLite backend is enabled.
+
+    Fetchers call this next to writing the JSON file.
+
+    Args:
+        source: Source name (directory under data/, e.g. "videos")
+        filename: File name of the item
+        item: Item dictionary
+    """
+    if is_enabled():
+        get_store().upsert_item(source, filename, item)
+
+
+def main():
+    """Import, export or query the SQLite store from the command line."""
+    parser = argparse.ArgumentParser(description="Manage the SQLite digest store")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("import", help="Load data/ into the database")
+    subparsers.add_parser("export", help="Write data/ from the database")
+    recent = subparsers.add_parser("recent", help="List recently published items")
+    recent.add_argument("--days", type=int, default=7, help="Window size in days (default: 7)")
+    args = parser.parse_args()
+
+    with DigestStore() as store:
+        if args.command == "import":
+            count = store.import_filesystem()
+            logger.info(f"Imported {count} items into {store.path}")
+        elif args.command == "export":
+            count = store.export_filesystem()
+            logger.info(f"Exported {count} items to {DATA_DIR}")
+        else:
+            for source in SOURCES:
+                for item in store.items_since(source, args.days):
+                    print(
+                        f"{published_of(item)}  {source:<12} {item.get('title', item.get('url'))}"
+                    )
+
+
+if __name__ == "__main__":
+    main()
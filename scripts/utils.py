@@ -2,7 +2,7 @@
 Shared utility functions for all scrapers.
 
 This module provides common functionality for:
-- HTTP requests with retry logic
+- HTTP requests with retry logic (one shared, pooled keep-alive session)
 - File I/O operations
 - Date/time utilities
 - Content processing
@@ -12,14 +12,19 @@ This module provides common functionality for:
 
 import json
 import re
+import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Dict, Optional
 from urllib.parse import urlparse
 
+import certifi
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 
 
 # ============================================================================
@@ -50,10 +55,242 @@ class ParsingError(ScraperError):
 # ============================================================================
 
 
+# Shared HTTP client settings
+USER_AGENT = "Mozilla/5.0 (compatible; GitHub-Copilot-Daily-Digest/1.0)"
+HTTP_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.5
+HTTP_POOL_MAXSIZE = 10  # Keep-alive connections per host
+
+_http_sessions: Dict[int, requests.Session] = {}
+
+
+def create_http_session(
+    retries: int = HTTP_RETRIES,
+    backoff_factor: float = HTTP_BACKOFF_FACTOR,
+    pool_maxsize: int = HTTP_POOL_MAXSIZE,
+) -> requests.Session:
+    """
+    Create an HTTP session with pooled keep-alive connections and retries.
+
+    - One connection pool per host, each holding up to pool_maxsize connections
+    - Retries with exponential backoff on connection errors and 429/5xx
+      (Retry-After is honoured)
+    - gzip/deflate, plus brotli when the optional brotli package is installed
+    - Consistent User-Agent and certifi CA bundle for every request
+
+    Args:
+        retries: Retry attempts per request (default: 3)
+        backoff_factor: Backoff factor between retries (default: 0.5)
+        pool_maxsize: Maximum kept-alive connections per host (default: 10)
+
+    Returns:
+        requests.Session: Configured session
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["HEAD", "GET"],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(
+        {
+            "User-Agent": USER_AGENT,
+            # Advertises "br" only if urllib3 can decode it
+            "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
+        }
+    )
+    session.verify = certifi.where()
+    return session
+
+
+def get_http_session(retries: int = HTTP_RETRIES) -> requests.Session:
+    """
+    Get the shared HTTP session, creating it on first use.
+
+    All scrapers share one session (per retry policy) so connections to
+    github.blog, docs.github.com, youtube.com, etc. are reused across requests.
+
+    Args:
+        retries: Retry attempts per request (default: 3)
+
+    Returns:
+        requests.Session: Shared session
+    """
+    if retries not in _http_sessions:
+        _http_sessions[retries] = create_http_session(retries=retries)
+    return _http_sessions[retries]
+
+
+class HostRateLimiter:
+    """
+    Thread-safe token-bucket rate limiter with one bucket per host.
+
+    Each host gets `burst` tokens that refill at `rate` tokens per second;
+    acquire() blocks until a token for the URL's host is available. Requests
+    to different hosts never wait on each other.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, list] = {}  # host -> [tokens, last refill time]
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> None:
+        """
+        Block until a request to the URL's host is allowed.
+
+        Args:
+            url: URL about to be requested
+        """
+        host = urlparse(url).netloc
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                bucket = self._buckets.setdefault(host, [float(self.burst), now])
+                bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+                if bucket[0] >= 1:
+                    bucket[0] -= 1
+                    return
+                wait = (1 - bucket[0]) / self.rate
+            time.sleep(wait)
+
+
+# Persistent store of HTTP validators (ETag / Last-Modified), keyed by URL
+HTTP_VALIDATORS_FILE = Path(__file__).parent.parent / "data" / "http-validators.json"
+
+_http_validators: Optional[Dict[str, Dict[str, str]]] = None
+_http_validators_lock = threading.Lock()
+
+
+def load_http_validators() -> Dict[str, Dict[str, str]]:
+    """
+    Load the validator store, once per process.
+
+    Returns:
+        dict: URL -> {"etag": ..., "last_modified": ...}
+    """
+    global _http_validators
+    with _http_validators_lock:
+        if _http_validators is None:
+            try:
+                with open(HTTP_VALIDATORS_FILE, encoding="utf-8") as f:
+                    _http_validators = json.load(f)
+            except FileNotFoundError:
+                _http_validators = {}
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Ignoring unreadable validator store {HTTP_VALIDATORS_FILE}: {e}")
+                _http_validators = {}
+    return _http_validators
+
+
+def conditional_headers(url: str) -> Dict[str, str]:
+    """
+    Build If-None-Match / If-Modified-Since headers for a URL.
+
+    Args:
+        url: URL about to be fetched
+
+    Returns:
+        dict: Conditional request headers (empty if no validators are stored)
+    """
+    validators = load_http_validators().get(url, {})
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def record_http_validators(url: str, response: requests.Response) -> None:
+    """
+    Remember the ETag / Last-Modified validators of a successful response.
+
+    Call this only once the response has been fully processed, so that a
+    failed run does not turn into a 304 (and a skipped update) on the next one.
+
+    Args:
+        url: URL that was fetched
+        response: Response with status 200
+    """
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    validators = load_http_validators()
+
+    entry = {}
+    if etag:
+        entry["etag"] = etag
+    if last_modified:
+        entry["last_modified"] = last_modified
+
+    if validators.get(url) == (entry or None):
+        return
+    if entry:
+        validators[url] = entry
+    else:
+        validators.pop(url, None)
+    safe_write_file(str(HTTP_VALIDATORS_FILE), json.dumps(validators, indent=2, sort_keys=True))
+
+
+def forget_http_validators(url: str) -> None:
+    """
+    Drop the stored validators for a URL, forcing a full download next time.
+
+    Args:
+        url: URL whose locally saved copy is no longer the server's version
+    """
+    validators = load_http_validators()
+    if validators.pop(url, None) is not None:
+        safe_write_file(str(HTTP_VALIDATORS_FILE), json.dumps(validators, indent=2, sort_keys=True))
+
+
+def conditional_get(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = 30,
+    conditional: bool = True,
+    **kwargs,
+) -> requests.Response:
+    """
+    Issue a conditional GET using the stored validators for the URL.
+
+    A 304 status on the returned response means the resource is unchanged
+    since the validators were recorded; the body is empty and the caller
+    should skip parsing and any downstream writes.
+
+    Args:
+        url: URL to fetch
+        headers: Extra request headers
+        timeout: Request timeout in seconds (default: 30)
+        conditional: Set to False to force a full download, e.g. when the
+            previously downloaded copy is missing locally
+        **kwargs: Passed through to Session.get
+
+    Returns:
+        requests.Response: The response (not checked with raise_for_status)
+    """
+    request_headers = dict(headers or {})
+    if conditional:
+        request_headers.update(conditional_headers(url))
+    return get_http_session().get(url, headers=request_headers, timeout=timeout, **kwargs)
+
+
 def fetch_url(url: str, retries: int = 3, timeout: int = 30) -> str:
     """
     Fetch URL with exponential backoff retry logic.
 
+    For a conditional request use conditional_get(), which returns the
+    response so the caller can record its validators once it is saved.
+
     Args:
         url: URL to fetch
         retries: Number of retry attempts (default: 3)
@@ -65,13 +302,14 @@ def fetch_url(url: str, retries: int = 3, timeout: int = 30) -> str:
     Raises:
         NetworkError: If all retry attempts fail
     """
-    headers = {"User-Agent": "copilot-daily-digest/1.0"}
+    # This function runs its own retry loop, so use a session without adapter retries
+    session = get_http_session(retries=0)
 
     last_error = None
     for attempt in range(retries):
         try:
             logger.debug(f"Fetching {url} (attempt {attempt + 1}/{retries})")
-            response = requests.get(url, headers=headers, timeout=timeout)
+            response = session.get(url, timeout=timeout)
             response.raise_for_status()
             logger.debug(f"Successfully fetched {url}")
             return response.text
@@ -133,10 +371,8 @@ def is_url_accessible(url: str) -> bool:
     Returns:
         bool: True if URL is accessible, False otherwise
     """
-    headers = {"User-Agent": "copilot-daily-digest/1.0"}
-
     try:
-        response = requests.head(url, headers=headers, timeout=10, allow_redirects=True)
+        response = get_http_session().head(url, timeout=10, allow_redirects=True)
         is_accessible = response.status_code < 400
         logger.debug(f"URL {url} accessible: {is_accessible} (status: {response.status_code})")
         return is_accessible
@@ -4,22 +4,38 @@ Link Validation Script
 Validates all links (internal and external) in markdown files.
 """
 
+import argparse
 import json
 import re
 import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+
+
+# Add parent directory to path to import local modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts import utils
 
 
 # Configuration
 TIMEOUT = 10  # seconds
 MAX_RETRIES = 3
 BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Concurrent external checks: at most MAX_WORKERS requests in flight, no more
+# than PER_HOST_LIMIT of them to the same host, and nothing new is started
+# after DEADLINE seconds (links not checked by then are reported as unchecked)
+MAX_WORKERS = 16
+PER_HOST_LIMIT = 4
+DEADLINE = 300  # seconds
 
 # Patterns
 MD_LINK_PATTERN = r"\[([^\]]*)\]\(([^\)]+)\)"
@@ -29,6 +45,9 @@ HTML_LINK_PATTERN = r'<a\s+(?:[^>]*?\s+)?href="([^"]*)"'
 MARKDOWN_DIRS = ["content", "docs", "scraper", "scripts", "tasks", ".github"]
 MARKDOWN_FILES = ["README.md"]
 
+# Written by generate_content.py: content pages changed in the last build
+CHANGED_PAGES_FILE = Path("data") / "changed-pages.json"
+
 # Links to skip (known to be problematic or not real URLs)
 SKIP_LINKS = {
     "#",  # Internal anchor only
@@ -38,20 +57,13 @@ SKIP_LINKS = {
 
 
 def create_http_session() -> requests.Session:
-    """Create HTTP session with retry logic."""
-    session = requests.Session()
-    retry = Retry(
-        total=MAX_RETRIES,
-        read=MAX_RETRIES,
-        connect=MAX_RETRIES,
-        backoff_factor=BACKOFF_FACTOR,
-        status_forcelist=[429, 500, 502, 503, 504],
-    )
-    adapter = HTTPAdapter(max_retries=retry)
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
-    session.headers.update({"User-Agent": "Mozilla/5.0 (compatible; LinkValidator/1.0)"})
-    return session
+    """
+    Create HTTP session for link checks (shared client factory from utils).
+
+    The session itself does not retry: validate_external_link() retries on
+    its own, so every attempt can be bounded by the link-check deadline.
+    """
+    return utils.create_http_session(retries=0)
 
 
 def find_markdown_files(base_path: Path) -> List[Path]:
@@ -73,6 +85,16 @@ def find_markdown_files(base_path: Path) -> List[Path]:
     return sorted(md_files)
 
 
+def find_changed_pages(base_path: Path) -> List[Path]:
+    """Find the content pages that changed in the last generate_content.py run."""
+    changed_file = base_path / CHANGED_PAGES_FILE
+    if not changed_file.exists():
+        return []
+    with open(changed_file, encoding="utf-8") as f:
+        pages = json.load(f)
+    return sorted(base_path / "content" / page for page in pages if (base_path / "content" / page).exists())
+
+
 def extract_links(content: str, file_path: Path) -> List[Tuple[str, str, int]]:
     """
     Extract all links from markdown content.
@@ -311,36 +333,164 @@ def validate_internal_link(
     return True, ""
 
 
-def validate_external_link(url: str, session: requests.Session) -> Tuple[bool, str]:
+def validate_external_link(
+    url: str, session: requests.Session, end: Optional[float] = None
+) -> Optional[Tuple[bool, str]]:
     """
     Validate external (HTTP/HTTPS) link.
     Returns (is_valid, error_message).
-    """
-    try:
-        response = session.head(url, timeout=TIMEOUT, allow_redirects=True)
 
-        # Some servers don't support HEAD, try GET
-        if response.status_code == 405:
-            response = session.get(url, timeout=TIMEOUT, allow_redirects=True, stream=True)
+    Connection errors, timeouts and 429/5xx responses are retried up to
+    MAX_RETRIES times with exponential backoff. The retries happen here, not
+    in the session, so that with `end` (a time.monotonic() value) every
+    attempt's timeout is capped at the time left and no backoff runs past it.
+    Returns None if the check was cut short by `end`.
+    """
+    result: Optional[Tuple[bool, str]] = None
+    capped = False
+
+    def timeout() -> float:
+        """Timeout for the next request; sets `capped` if the deadline shortens it."""
+        nonlocal capped
+        if end is None or end - time.monotonic() >= TIMEOUT:
+            return TIMEOUT
+        capped = True
+        return end - time.monotonic()
+
+    for attempt in range(MAX_RETRIES + 1):
+        if attempt:
+            delay = BACKOFF_FACTOR * 2 ** (attempt - 1)
+            if end is not None and time.monotonic() + delay >= end:
+                return None
+            time.sleep(delay)
+
+        capped = False
+        try:
+            if timeout() <= 0:
+                return None
+            response = session.head(url, timeout=timeout(), allow_redirects=True)
+
+            # Some servers don't support HEAD, try GET
+            if response.status_code == 405:
+                if timeout() <= 0:
+                    return None
+                response = session.get(url, timeout=timeout(), allow_redirects=True, stream=True)
+                # Only the status is needed; don't download the body
+                response.close()
+
+        except requests.exceptions.TooManyRedirects:
+            return False, "Too many redirects"
+        except requests.exceptions.RequestException as e:
+            # Any failure of an attempt shortened by the deadline says nothing
+            # about the link
+            if capped:
+                return None
+            if isinstance(e, requests.exceptions.Timeout):
+                result = (False, "Timeout")
+            else:
+                result = (False, str(e))
+            if isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+                continue
+            return result
+        except Exception as e:
+            return False, f"Unexpected error: {str(e)}"
 
+        if response.status_code in RETRY_STATUSES:
+            result = (False, f"HTTP {response.status_code}")
+            continue
         if response.status_code >= 400:
             return False, f"HTTP {response.status_code}"
-
         return True, ""
 
-    except requests.exceptions.Timeout:
-        return False, "Timeout"
-    except requests.exceptions.TooManyRedirects:
-        return False, "Too many redirects"
-    except requests.exceptions.RequestException as e:
-        return False, str(e)
-    except Exception as e:
-        return False, f"Unexpected error: {str(e)}"
+    return result
+
+
+def interleave_by_host(urls: List[str]) -> List[str]:
+    """
+    Order URLs round-robin across hosts.
+
+    Workers then rarely sit waiting on one host's concurrency cap while
+    other hosts' links are still queued.
+    """
+    by_host: Dict[str, List[str]] = {}
+    for url in urls:
+        by_host.setdefault(urlparse(url).netloc.lower(), []).append(url)
+    queues = list(by_host.values())
+    ordered = []
+    for i in range(max((len(queue) for queue in queues), default=0)):
+        ordered.extend(queue[i] for queue in queues if i < len(queue))
+    return ordered
+
+
+def validate_external_links(
+    urls: List[str],
+    session: requests.Session,
+    max_workers: int = MAX_WORKERS,
+    per_host_limit: int = PER_HOST_LIMIT,
+    deadline: float = DEADLINE,
+) -> Dict[str, Optional[Tuple[bool, str]]]:
+    """
+    Validate external links concurrently, each distinct URL once.
 
+    Returns a mapping of URL -> (is_valid, error_message), or None for URLs
+    that were not checked before the deadline.
+    """
+    unique_urls = sorted(set(urls))
+    results: Dict[str, Optional[Tuple[bool, str]]] = dict.fromkeys(unique_urls)
+    if not unique_urls:
+        return results
+
+    end = time.monotonic() + deadline
+    host_slots = {
+        urlparse(url).netloc.lower(): threading.BoundedSemaphore(per_host_limit)
+        for url in unique_urls
+    }
 
-def validate_links(base_path: Path) -> Dict:
+    def check(url: str) -> Optional[Tuple[bool, str]]:
+        slot = host_slots[urlparse(url).netloc.lower()]
+        # Wait for a free slot on this host, but never past the deadline
+        if not slot.acquire(timeout=max(0.0, end - time.monotonic())):
+            return None
+        try:
+            if time.monotonic() >= end:
+                return None
+            return validate_external_link(url, session, end)
+        finally:
+            slot.release()
+
+    print(f"Checking {len(unique_urls)} distinct external URLs ({max_workers} workers)...")
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = {executor.submit(check, url): url for url in interleave_by_host(unique_urls)}
+    pending = set(futures)
+    while pending:
+        remaining = end - time.monotonic()
+        if remaining <= 0:
+            break
+        done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        for future in done:
+            results[futures[future]] = future.result()
+
+    if pending:
+        print(f"Deadline of {deadline}s reached, {len(pending)} external URLs not checked")
+        for future in pending:
+            future.cancel()
+    # Checks already in flight have their timeouts capped at the deadline, and
+    # queued ones return at once, so this wait ends around the deadline too
+    executor.shutdown(wait=True)
+
+    return results
+
+
+def validate_links(
+    base_path: Path,
+    md_files: Optional[List[Path]] = None,
+    max_workers: int = MAX_WORKERS,
+    per_host_limit: int = PER_HOST_LIMIT,
+    deadline: float = DEADLINE,
+) -> Dict:
     """
-    Validate all links in markdown files.
+    Validate all links in markdown files (or only in md_files, if given).
+    External links are checked concurrently (see validate_external_links).
     Returns report dictionary.
     """
     session = create_http_session()
@@ -353,21 +503,38 @@ def validate_links(base_path: Path) -> Dict:
         "broken_links": [],
         "emoji_violations": [],
         "skipped_links": 0,
+        "unchecked_links": [],
     }
 
-    md_files = find_markdown_files(base_path)
+    if md_files is None:
+        md_files = find_markdown_files(base_path)
     report["total_files"] = len(md_files)
 
     print(f"Found {len(md_files)} markdown files to check\n")
 
+    # Read every file first, so all external URLs can be checked concurrently
+    pages = []
+    external_urls = []
     for md_file in md_files:
-        rel_path = md_file.relative_to(base_path)
-        print(f"Checking: {rel_path}")
-
         with open(md_file, encoding="utf-8") as f:
             content = f.read()
-
         links = extract_links(content, md_file)
+        pages.append((md_file, content, links))
+        external_urls.extend(
+            url
+            for _, url, _ in links
+            if not should_skip_link(url) and urlparse(url).scheme in ("http", "https")
+        )
+
+    external_results = validate_external_links(
+        external_urls, session, max_workers, per_host_limit, deadline
+    )
+    print()
+
+    # Report in file and line order, whatever order the checks finished in
+    for md_file, content, links in pages:
+        rel_path = md_file.relative_to(base_path)
+        print(f"Checking: {rel_path}")
 
         # Check for emoji violations in linked headings
         emoji_violations = check_emoji_in_linked_headings(content, links)
@@ -392,7 +559,14 @@ def validate_links(base_path: Path) -> Dict:
 
             if is_external:
                 report["external_links"] += 1
-                is_valid, error = validate_external_link(url, session)
+                result = external_results.get(url)
+                if result is None:
+                    report["unchecked_links"].append(
+                        {"file": str(rel_path), "line": line_num, "url": url}
+                    )
+                    print(f"  ? Line {line_num}: {url[:60]} - not checked (deadline reached)")
+                    continue
+                is_valid, error = result
             else:
                 report["internal_links"] += 1
                 is_valid, error = validate_internal_link(url, md_file, base_path, content)
@@ -431,6 +605,7 @@ def print_report(report: Dict):
     print(f"Broken links:         {len(report['broken_links'])}")
     print(f"Emoji violations:     {len(report['emoji_violations'])}")
     print(f"Skipped links:        {report['skipped_links']}")
+    print(f"Unchecked links:      {len(report['unchecked_links'])}")
     print()
 
     has_issues = False
@@ -485,6 +660,32 @@ def save_report(report: Dict, output_file: Path):
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Validate links in markdown files")
+    parser.add_argument(
+        "--changed-only",
+        action="store_true",
+        help="Only check content pages changed by the last generate_content.py run",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=MAX_WORKERS,
+        help=f"External link checks in flight (default: {MAX_WORKERS})",
+    )
+    parser.add_argument(
+        "--per-host",
+        type=int,
+        default=PER_HOST_LIMIT,
+        help=f"External link checks in flight per host (default: {PER_HOST_LIMIT})",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=DEADLINE,
+        help=f"Seconds after which no new external check is started (default: {DEADLINE})",
+    )
+    args = parser.parse_args()
+
     base_path = Path(__file__).parent.parent
 
     print("Link Validation Script")
@@ -492,7 +693,8 @@ def main():
     print(f"Base path: {base_path}\n")
 
     # Validate links
-    report = validate_links(base_path)
+    md_files = find_changed_pages(base_path) if args.changed_only else None
+    report = validate_links(base_path, md_files, args.workers, args.per_host, args.deadline)
 
     # Save report
     output_file = base_path / "link-validation-report.json"